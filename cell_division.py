@@ -1,9 +1,16 @@
+import textwrap
+
 import numpy as np
 import matplotlib.pyplot as plt
 from matplotlib.widgets import Slider, Button, RadioButtons
 from matplotlib.animation import FuncAnimation
-from matplotlib.patches import Circle, FancyBboxPatch, Polygon
-from matplotlib import cm
+from matplotlib.patches import Circle
+from matplotlib.collections import EllipseCollection, LineCollection, PolyCollection
+
+try:
+    from numba import njit
+except ImportError:  # numba is optional; fall back to vectorized NumPy
+    njit = None
 
 # -----------------------------
 # Cell Division (Mitosis) Simulator
@@ -19,6 +26,9 @@ STAGES = {
     "Cytokinesis": 5
 }
 
+# Reverse lookup: stage index -> name, O(1) instead of scanning STAGES
+STAGE_NAMES = tuple(STAGES.keys())
+
 STAGE_DESCRIPTIONS = {
     "Interphase": "Cell grows, DNA replicates. Chromosomes are not visible.",
     "Prophase": "Chromosomes condense, nuclear envelope breaks down, spindle forms.",
@@ -28,6 +38,44 @@ STAGE_DESCRIPTIONS = {
     "Cytokinesis": "Cell membrane pinches inward, forming two daughter cells."
 }
 
+# Descriptions wrapped once at import time; the per-frame info panel
+# update is then just a dict lookup
+_WRAPPED_DESCRIPTIONS = {name: textwrap.fill(desc, 32)
+                         for name, desc in STAGE_DESCRIPTIONS.items()}
+
+_KEY_FEATURES = {
+    0: "• Cell growth\n"
+       "• DNA replication\n"
+       "• Preparation for division",
+    1: "• Chromosomes condense\n"
+       "• Nuclear envelope breaks\n"
+       "• Spindle apparatus forms",
+    2: "• Chromosomes align\n"
+       "• At metaphase plate\n"
+       "• Spindle fibers attach",
+    3: "• Sister chromatids separate\n"
+       "• Move to opposite poles\n"
+       "• Cell begins to elongate",
+    4: "• Chromosomes decondense\n"
+       "• Nuclear envelopes reform\n"
+       "• Cell membrane pinches",
+    5: "• Two daughter cells form\n"
+       "• Each with full chromosome set\n"
+       "• Process complete!",
+}
+
+# The info panel only depends on the stage, so the complete text is
+# assembled once per stage at import time
+_INFO_TEXTS = tuple(
+    f"MITOSIS SIMULATOR\n"
+    f"{'='*28}\n\n"
+    f"Current Stage: {name}\n"
+    f"Stage {idx + 1} of {len(STAGES)}\n\n"
+    f"Description:\n{_WRAPPED_DESCRIPTIONS[name]}\n\n"
+    f"Key Features:\n{_KEY_FEATURES[idx]}"
+    for name, idx in STAGES.items()
+)
+
 # -----------------------------
 # Initial parameters
 # -----------------------------
@@ -35,6 +83,15 @@ num_chromosomes = 4  # Number of chromosome pairs (diploid)
 cell_radius = 1.0
 nucleus_radius = 0.6
 
+# Precomputed position tables (constant for a given chromosome count),
+# so the per-frame stage branches only index instead of redoing trig
+_PROPHASE_ANGLES = np.arange(num_chromosomes * 2) * (2 * np.pi / (num_chromosomes * 2))
+_PROPHASE_COS = np.cos(_PROPHASE_ANGLES)
+_PROPHASE_SIN = np.sin(_PROPHASE_ANGLES)
+_META_X = np.linspace(-0.5, 0.5, num_chromosomes)  # metaphase plate positions
+# Anaphase horizontal spread direction: even pairs right on top, odd pairs left
+_ANA_SIGNS = np.where(np.arange(num_chromosomes) % 2 == 0, 1.0, -1.0)
+
 # State
 state = {
     "stage": 0,  # Current stage index
@@ -57,13 +114,59 @@ ax.set_xlim(-2.5, 2.5)
 ax.set_ylim(-1.8, 1.8)
 ax.axis('off')
 
-# Cell membrane (will be updated)
-cell_membrane = None
-nucleus = None
-chromosomes = []
-spindle_fibers = []
-centrosomes = []
-text_elements = []  # Track text elements to remove them
+# -----------------------------
+# Persistent artists
+# -----------------------------
+# All artists are allocated once here and mutated per frame via set_center /
+# set_radius / set_xy / set_visible, instead of being removed and rebuilt on
+# every animation tick. This avoids per-frame Python allocation and
+# matplotlib artist-list churn, which dominates the cost of the redraw.
+
+# Cell membranes: one circle for the single cell, a second for the
+# pinching/divided stages (Telophase, Cytokinesis)
+membrane_a = Circle((0, 0), cell_radius, fill=False, edgecolor='black', lw=3, zorder=1)
+membrane_b = Circle((0, 0), cell_radius, fill=False, edgecolor='black', lw=3, zorder=1)
+ax.add_patch(membrane_a)
+ax.add_patch(membrane_b)
+
+# Nuclei: one for the parent cell, a second for the two daughter cells
+nucleus_a = Circle((0, 0), nucleus_radius, fill=True, facecolor='lightblue',
+                   edgecolor='darkblue', lw=2, alpha=0.5, zorder=2)
+nucleus_b = Circle((0, 0), nucleus_radius, fill=True, facecolor='lightblue',
+                   edgecolor='darkblue', lw=2, alpha=0.5, zorder=2)
+ax.add_patch(nucleus_a)
+ax.add_patch(nucleus_b)
+
+# Centrosomes: both circles in one collection, repositioned via set_offsets
+_CENTRO_OFFSETS = np.zeros((2, 2))
+centro_col = EllipseCollection(widths=0.16, heights=0.16, angles=0, units='xy',
+                               offsets=_CENTRO_OFFSETS, offset_transform=ax.transData,
+                               facecolor='red', edgecolor='darkred', lw=2, zorder=4)
+ax.add_collection(centro_col)
+
+# Chromatid X-shapes: all polygons (two per chromosome) batched into a
+# single collection whose vertices are recomputed vectorized per frame
+chrom_pc = PolyCollection([], closed=True, edgecolors='black', linewidths=1, zorder=5)
+ax.add_collection(chrom_pc)
+
+# Spindle fibers: one collection holding all segments (two per chromosome),
+# rendered in a single C-level path loop instead of 2N Line2D artists
+spindle_lc = LineCollection(np.empty((0, 2, 2)), colors='gray', lw=1, alpha=0.5, zorder=3)
+ax.add_collection(spindle_lc)
+
+# Static texts
+center_text = ax.text(0, 0, "DNA\nreplicating", ha='center', va='center', fontsize=10, zorder=3)
+daughter_texts = [
+    ax.text(0, 0, f"Daughter\nCell {i + 1}", ha='center', va='center',
+            fontsize=11, fontweight='bold', zorder=4,
+            bbox=dict(boxstyle="round,pad=0.3", facecolor="white", alpha=0.8))
+    for i in range(2)
+]
+
+# Separated chromatids: one persistent collection, mutated per frame like
+# the others instead of churning fresh Line2D artists through ax.plot
+sep_lc = LineCollection(np.empty((0, 2, 2)), linewidths=4, zorder=5)
+ax.add_collection(sep_lc)
 
 # Stage label
 stage_label = ax.text(0, -1.6, "", ha='center', va='top', fontsize=14, fontweight='bold',
@@ -85,446 +188,376 @@ info_text = ax_text.text(
     bbox=dict(boxstyle="round,pad=0.8", facecolor="white", alpha=0.95, edgecolor="gray", linewidth=1.5)
 )
 
-# -----------------------------
-# Chromosome class
-# -----------------------------
-class Chromosome:
-    def __init__(self, center, angle, length=0.15, width=0.08, color='blue', pair_id=0):
-        self.center = np.array(center)
-        self.angle = angle
-        self.length = length
-        self.width = width
-        self.color = color
-        self.pair_id = pair_id
-        self.is_separated = False
-        self.patch = None
-        
-    def draw(self, ax):
-        """Draw chromosome as an X shape (two chromatids)."""
-        if self.patch is not None:
-            if isinstance(self.patch, list):
-                for p in self.patch:
-                    p.remove()
-            else:
-                self.patch.remove()
-        
-        # Create X shape for chromosome
-        cx, cy = self.center
-        
-        # Two chromatids forming X
-        if not self.is_separated:
-            # Draw as X (two chromatids joined)
-            points1 = [
-                [cx - self.length/2 * np.cos(self.angle), cy - self.length/2 * np.sin(self.angle)],
-                [cx + self.length/2 * np.cos(self.angle), cy + self.length/2 * np.sin(self.angle)],
-                [cx + self.length/2 * np.cos(self.angle) + self.width * np.sin(self.angle), 
-                 cy + self.length/2 * np.sin(self.angle) - self.width * np.cos(self.angle)],
-                [cx - self.length/2 * np.cos(self.angle) + self.width * np.sin(self.angle), 
-                 cy - self.length/2 * np.sin(self.angle) - self.width * np.cos(self.angle)]
-            ]
-            points2 = [
-                [cx - self.length/2 * np.cos(self.angle), cy - self.length/2 * np.sin(self.angle)],
-                [cx + self.length/2 * np.cos(self.angle), cy + self.length/2 * np.sin(self.angle)],
-                [cx + self.length/2 * np.cos(self.angle) - self.width * np.sin(self.angle), 
-                 cy + self.length/2 * np.sin(self.angle) + self.width * np.cos(self.angle)],
-                [cx - self.length/2 * np.cos(self.angle) - self.width * np.sin(self.angle), 
-                 cy - self.length/2 * np.sin(self.angle) + self.width * np.cos(self.angle)]
-            ]
-            poly1 = Polygon(points1, closed=True, facecolor=self.color, edgecolor='black', lw=1, zorder=5)
-            poly2 = Polygon(points2, closed=True, facecolor=self.color, edgecolor='black', lw=1, zorder=5)
-            ax.add_patch(poly1)
-            ax.add_patch(poly2)
-            self.patch = [poly1, poly2]
-        else:
-            # Draw as separated chromatids (two lines)
-            offset = self.width
-            p1 = [cx - self.length/2 * np.cos(self.angle) + offset * np.sin(self.angle),
-                  cy - self.length/2 * np.sin(self.angle) - offset * np.cos(self.angle)]
-            p2 = [cx + self.length/2 * np.cos(self.angle) + offset * np.sin(self.angle),
-                  cy + self.length/2 * np.sin(self.angle) - offset * np.cos(self.angle)]
-            ax.plot([p1[0], p2[0]], [p1[1], p2[1]], color=self.color, lw=4, zorder=5)
-            
-            p3 = [cx - self.length/2 * np.cos(self.angle) - offset * np.sin(self.angle),
-                  cy - self.length/2 * np.sin(self.angle) + offset * np.cos(self.angle)]
-            p4 = [cx + self.length/2 * np.cos(self.angle) - offset * np.sin(self.angle),
-                  cy + self.length/2 * np.sin(self.angle) + offset * np.cos(self.angle)]
-            ax.plot([p3[0], p4[0]], [p3[1], p4[1]], color=self.color, lw=4, zorder=5)
-            self.patch = None
-
 # -----------------------------
 # Helper functions
 # -----------------------------
-def clear_elements():
-    """Clear all visual elements."""
-    global cell_membrane, nucleus, chromosomes, spindle_fibers, centrosomes, text_elements
-    
-    if cell_membrane is not None:
-        if isinstance(cell_membrane, list):
-            for cm in cell_membrane:
-                cm.remove()
-        else:
-            cell_membrane.remove()
-        cell_membrane = None
-    
-    if nucleus is not None:
-        if isinstance(nucleus, list):
-            for n in nucleus:
-                n.remove()
-        else:
-            nucleus.remove()
-        nucleus = None
-    
-    for chrom in chromosomes:
-        if chrom.patch is not None:
-            if isinstance(chrom.patch, list):
-                for p in chrom.patch:
-                    p.remove()
-            else:
-                chrom.patch.remove()
-    chromosomes = []
-    
-    for fiber in spindle_fibers:
-        fiber.remove()
-    spindle_fibers = []
-    
-    for centrosome in centrosomes:
-        centrosome.remove()
-    centrosomes = []
-    
-    # Remove text elements
-    for text in text_elements:
-        text.remove()
-    text_elements = []
+# Chromosomes are kept as parallel arrays (centers, angles, lengths,
+# widths, colors) rather than a list of per-chromosome Python objects;
+# each stage branch fills the arrays and hands them to _draw_joined /
+# _draw_separated in one batch.
+def _chromatid_verts_kernel(centers, angles, lengths, widths, out):
+    """X-shape vertex kernel: fills out[:2N] with (4, 2) polygon vertices.
+
+    Written as explicit loops so Numba can compile it to a single native
+    pass without the temporaries the broadcast version would allocate.
+    """
+    for i in range(len(centers)):
+        cx, cy = centers[i, 0], centers[i, 1]
+        cos_a = np.cos(angles[i])
+        sin_a = np.sin(angles[i])
+        half_x = 0.5 * lengths[i] * cos_a   # along chromatid
+        half_y = 0.5 * lengths[i] * sin_a
+        off_x = widths[i] * sin_a           # across it
+        off_y = -widths[i] * cos_a
+        for k in range(2):
+            sign = 1.0 if k == 0 else -1.0
+            v = out[2 * i + k]
+            v[0, 0] = cx - half_x
+            v[0, 1] = cy - half_y
+            v[1, 0] = cx + half_x
+            v[1, 1] = cy + half_y
+            v[2, 0] = cx + half_x + sign * off_x
+            v[2, 1] = cy + half_y + sign * off_y
+            v[3, 0] = cx - half_x + sign * off_x
+            v[3, 1] = cy - half_y + sign * off_y
+    return out
+
+if njit is not None:
+    _chromatid_verts_kernel = njit(cache=True, fastmath=True)(_chromatid_verts_kernel)
+
+# Preallocated vertex buffer sized for the most chromosomes ever on
+# screen (2 per pair in Prophase/Anaphase, 2 polygons each)
+_VERTS_BUF = np.empty((4 * num_chromosomes, 4, 2))
+
+def _chromatid_verts(centers, angles, lengths, widths):
+    """X-shape vertices for all chromosomes as a (2N, 4, 2) array."""
+    return _chromatid_verts_kernel(centers, angles, lengths, widths,
+                                   _VERTS_BUF[:2 * len(centers)])
+
+def _chromatid_segments(centers, angles, lengths, widths):
+    """Vectorized separated-chromatid line segments.
+
+    Returns a (2N, 2, 2) array of segment endpoints (two parallel
+    chromatids per chromosome, offset to either side of the axis).
+    """
+    cos_a = np.cos(angles)
+    sin_a = np.sin(angles)
+    half = 0.5 * lengths
+    axis = np.stack([half * cos_a, half * sin_a], axis=-1)
+    offset = np.stack([widths * sin_a, -widths * cos_a], axis=-1)
+
+    segs = np.empty((2 * len(centers), 2, 2))
+    for k, sign in ((0, 1.0), (1, -1.0)):
+        s = segs[k::2]
+        s[:, 0] = centers - axis + sign * offset
+        s[:, 1] = centers + axis + sign * offset
+    return segs
+
+def _show_centrosomes(top, bottom, radius):
+    """Position both centrosomes via the shared offsets buffer."""
+    _CENTRO_OFFSETS[0] = top
+    _CENTRO_OFFSETS[1] = bottom
+    centro_col.set_offsets(_CENTRO_OFFSETS)
+    centro_col.set_widths(2 * radius)
+    centro_col.set_heights(2 * radius)
+    centro_col.set_visible(True)
+
+def _place_circle(circle, center, radius):
+    """Move/resize a pooled circle and show it, skipping no-op set_* calls.
+
+    set_center/set_radius mark the artist stale even when the value is
+    unchanged, and the membrane geometry is constant in most stages.
+    """
+    if circle.get_center() != center:
+        circle.set_center(center)
+    if circle.get_radius() != radius:
+        circle.set_radius(radius)
+    circle.set_visible(True)
+
+def _draw_joined(centers, angles, lengths, widths, chrom_colors):
+    """Show joined X-shaped chromosomes via the batched collection."""
+    chrom_pc.set_verts(_chromatid_verts(centers, angles, lengths, widths))
+    chrom_pc.set_facecolor(np.repeat(chrom_colors, 2))
+    chrom_pc.set_visible(True)
+
+def _draw_separated(centers, angles, lengths, widths, chrom_colors):
+    """Show separated chromatids via the batched segment collection."""
+    sep_lc.set_segments(_chromatid_segments(centers, angles, lengths, widths))
+    sep_lc.set_color(np.repeat(chrom_colors, 2))
+    sep_lc.set_visible(True)
+
+def hide_all_artists():
+    """Hide all pooled artists (replaces per-frame remove/re-add churn)."""
+
+    for artist in (membrane_a, membrane_b, nucleus_a, nucleus_b,
+                   center_text):
+        artist.set_visible(False)
+    for text in daughter_texts:
+        text.set_visible(False)
+    centro_col.set_visible(False)
+    chrom_pc.set_visible(False)
+    spindle_lc.set_visible(False)
+    sep_lc.set_visible(False)
 
 def get_stage_name(index):
     """Get stage name from index."""
-    for name, idx in STAGES.items():
-        if idx == index:
-            return name
+    if 0 <= index < len(STAGE_NAMES):
+        return STAGE_NAMES[index]
     return "Unknown"
 
+# Stages whose geometry does not depend on time: render them only once
+_STATIC_STAGES = (0, 2)
+_last_render_key = None
+
 def update_visualization():
     """Update the visualization based on current stage."""
-    global cell_membrane, nucleus, chromosomes, spindle_fibers, centrosomes
-    
-    clear_elements()
-    
+    global _last_render_key
+
     stage_idx = state["stage"]
     stage_name = get_stage_name(stage_idx)
     time = state["time"]
-    
+
+    # Skip the whole rebuild when nothing visible changed: static stages
+    # re-render only on stage change, animated stages only when the
+    # quantized time moved
+    if stage_idx in _STATIC_STAGES:
+        key = (stage_idx, None)
+    else:
+        key = (stage_idx, round(time, 2))
+    if key == _last_render_key:
+        return
+    _last_render_key = key
+
+    hide_all_artists()
+
     # Colors for chromosomes (different pairs)
     colors = ['blue', 'red', 'green', 'purple', 'orange', 'brown']
-    
+
     # Interphase
     if stage_idx == 0:
         # Cell membrane
-        cell_membrane = Circle((0, 0), cell_radius, fill=False, edgecolor='black', lw=3, zorder=1)
-        ax.add_patch(cell_membrane)
-        
+        _place_circle(membrane_a, (0, 0), cell_radius)
+
         # Nucleus (large, chromosomes not visible)
-        nucleus = Circle((0, 0), nucleus_radius, fill=True, facecolor='lightblue', 
-                        edgecolor='darkblue', lw=2, alpha=0.5, zorder=2)
-        ax.add_patch(nucleus)
-        text_elem = ax.text(0, 0, "DNA\nreplicating", ha='center', va='center', fontsize=10, zorder=3)
-        text_elements.append(text_elem)
-    
+        nucleus_a.set_center((0, 0))
+        nucleus_a.set_radius(nucleus_radius)
+        nucleus_a.set_alpha(0.5)
+        nucleus_a.set_visible(True)
+        center_text.set_visible(True)
+
     # Prophase
     elif stage_idx == 1:
         progress = min(time / 1.0, 1.0)  # Normalize to 0-1
-        
+
         # Cell membrane
-        cell_membrane = Circle((0, 0), cell_radius, fill=False, edgecolor='black', lw=3, zorder=1)
-        ax.add_patch(cell_membrane)
-        
+        _place_circle(membrane_a, (0, 0), cell_radius)
+
         # Nucleus shrinking/disappearing
         nucleus_size = nucleus_radius * (1 - progress * 0.8)
         if nucleus_size > 0.1:
-            nucleus = Circle((0, 0), nucleus_size, fill=True, facecolor='lightblue', 
-                            edgecolor='darkblue', lw=2, alpha=0.5 * (1 - progress), zorder=2)
-            ax.add_patch(nucleus)
-        
+            nucleus_a.set_center((0, 0))
+            nucleus_a.set_radius(nucleus_size)
+            nucleus_a.set_alpha(0.5 * (1 - progress))
+            nucleus_a.set_visible(True)
+
         # Chromosomes condensing (appearing and condensing)
         num_visible = int(progress * num_chromosomes * 2)
-        angle_step = 2 * np.pi / (num_chromosomes * 2)
-        
-        for i in range(num_visible):
-            angle = i * angle_step
+        if num_visible:
             dist = 0.3 + progress * 0.2
-            center = [dist * np.cos(angle), dist * np.sin(angle)]
-            chrom_angle = angle + np.pi/2
-            color = colors[i // 2 % len(colors)]
-            chrom = Chromosome(center, chrom_angle, length=0.1 + progress*0.05, 
-                             width=0.05, color=color, pair_id=i//2)
-            chrom.draw(ax)
-            chromosomes.append(chrom)
-        
+            centers = np.stack([dist * _PROPHASE_COS[:num_visible],
+                                dist * _PROPHASE_SIN[:num_visible]], axis=-1)
+            angles = _PROPHASE_ANGLES[:num_visible] + np.pi/2
+            lengths = np.full(num_visible, 0.1 + progress * 0.05)
+            widths = np.full(num_visible, 0.05)
+            chrom_colors = [colors[i // 2 % len(colors)] for i in range(num_visible)]
+            _draw_joined(centers, angles, lengths, widths, chrom_colors)
+
         # Centrosomes appearing
         centrosome_dist = 0.4 * progress
-        c1 = Circle((centrosome_dist, 0), 0.08, fill=True, facecolor='red', 
-                   edgecolor='darkred', lw=2, zorder=4)
-        c2 = Circle((-centrosome_dist, 0), 0.08, fill=True, facecolor='red', 
-                   edgecolor='darkred', lw=2, zorder=4)
-        ax.add_patch(c1)
-        ax.add_patch(c2)
-        centrosomes = [c1, c2]
-    
+        _show_centrosomes((centrosome_dist, 0), (-centrosome_dist, 0), 0.08)
+
     # Metaphase
     elif stage_idx == 2:
         # Cell membrane
-        cell_membrane = Circle((0, 0), cell_radius, fill=False, edgecolor='black', lw=3, zorder=1)
-        ax.add_patch(cell_membrane)
-        
+        _place_circle(membrane_a, (0, 0), cell_radius)
+
         # Chromosomes aligned at equator (pairs together, not separated yet)
-        for pair_id in range(num_chromosomes):
-            x_pos = -0.5 + (pair_id / max(1, num_chromosomes - 1)) * 1.0
-            center = [x_pos, 0]
-            chrom = Chromosome(center, np.pi/2, length=0.15, width=0.08, 
-                             color=colors[pair_id % len(colors)], pair_id=pair_id)
-            chrom.is_separated = False  # Ensure not separated in metaphase
-            chrom.draw(ax)
-            chromosomes.append(chrom)
-        
+        centers = np.stack([_META_X, np.zeros(num_chromosomes)], axis=-1)
+        angles = np.full(num_chromosomes, np.pi/2)
+        lengths = np.full(num_chromosomes, 0.15)
+        widths = np.full(num_chromosomes, 0.08)
+        chrom_colors = [colors[pair_id % len(colors)]
+                        for pair_id in range(num_chromosomes)]
+        _draw_joined(centers, angles, lengths, widths, chrom_colors)
+
         # Centrosomes at poles
-        c1 = Circle((0, cell_radius * 0.7), 0.1, fill=True, facecolor='red', 
-                   edgecolor='darkred', lw=2, zorder=4)
-        c2 = Circle((0, -cell_radius * 0.7), 0.1, fill=True, facecolor='red', 
-                   edgecolor='darkred', lw=2, zorder=4)
-        ax.add_patch(c1)
-        ax.add_patch(c2)
-        centrosomes = [c1, c2]
-        
-        # Spindle fibers
-        for chrom in chromosomes:
-            cx, cy = chrom.center
-            # Fiber to top centrosome
-            ax.plot([cx, 0], [cy, cell_radius * 0.7], 'gray', lw=1, alpha=0.5, zorder=3)
-            # Fiber to bottom centrosome
-            ax.plot([cx, 0], [cy, -cell_radius * 0.7], 'gray', lw=1, alpha=0.5, zorder=3)
-    
+        _show_centrosomes((0, cell_radius * 0.7), (0, -cell_radius * 0.7), 0.1)
+
+        # Spindle fibers: all segments (chromosome -> each pole) in one collection
+        segs = np.empty((2 * num_chromosomes, 2, 2))
+        segs[0::2, 0] = centers
+        segs[0::2, 1] = (0, cell_radius * 0.7)
+        segs[1::2, 0] = centers
+        segs[1::2, 1] = (0, -cell_radius * 0.7)
+        spindle_lc.set_segments(segs)
+        spindle_lc.set_visible(True)
+
     # Anaphase
     elif stage_idx == 3:
         progress = min(time / 1.0, 1.0)
-        
+
         # Cell membrane elongating
         elongation = progress * 0.4
-        cell_membrane = Circle((0, 0), cell_radius + elongation, fill=False, 
-                              edgecolor='black', lw=3, zorder=1)
-        ax.add_patch(cell_membrane)
-        
+        _place_circle(membrane_a, (0, 0), cell_radius + elongation)
+
         # Chromosomes separating and moving to poles
         pole_top_y = cell_radius * 0.7
         pole_bottom_y = -cell_radius * 0.7
-        
-        # Each chromosome pair separates - one chromatid goes to each pole
-        for pair_id in range(num_chromosomes):
-            # Starting position (from metaphase plate)
-            start_x = -0.5 + (pair_id / max(1, num_chromosomes - 1)) * 1.0
-            start_y = 0
-            
-            # Separation distance increases with progress
-            separation_x = progress * 0.2  # Horizontal spread
-            
-            # Top chromatid (moves to top pole)
-            top_y = start_y + progress * pole_top_y
-            top_x = start_x + separation_x * (1 if pair_id % 2 == 0 else -1)
-            chrom_top = Chromosome([top_x, top_y], np.pi/2, length=0.15, width=0.08, 
-                                 color=colors[pair_id % len(colors)], pair_id=pair_id)
-            chrom_top.is_separated = progress > 0.2  # Separate earlier
-            chrom_top.draw(ax)
-            chromosomes.append(chrom_top)
-            
-            # Bottom chromatid (moves to bottom pole)
-            bottom_y = start_y + progress * pole_bottom_y
-            bottom_x = start_x - separation_x * (1 if pair_id % 2 == 0 else -1)
-            chrom_bottom = Chromosome([bottom_x, bottom_y], np.pi/2, length=0.15, width=0.08, 
-                                    color=colors[pair_id % len(colors)], pair_id=pair_id)
-            chrom_bottom.is_separated = progress > 0.2  # Separate earlier
-            chrom_bottom.draw(ax)
-            chromosomes.append(chrom_bottom)
-        
+
+        # Each chromosome pair separates - one chromatid goes to each pole.
+        # All positions come from one vectorized expression over the
+        # precomputed metaphase plate / spread-sign tables.
+        separation_x = progress * 0.2  # Horizontal spread
+        top_centers = np.stack(
+            [_META_X + separation_x * _ANA_SIGNS,
+             np.full(num_chromosomes, progress * pole_top_y)], axis=-1)
+        bottom_centers = np.stack(
+            [_META_X - separation_x * _ANA_SIGNS,
+             np.full(num_chromosomes, progress * pole_bottom_y)], axis=-1)
+        ana_centers = np.concatenate([top_centers, bottom_centers])
+        ana_angles = np.full(len(ana_centers), np.pi/2)
+        ana_lengths = np.full(len(ana_centers), 0.15)
+        ana_widths = np.full(len(ana_centers), 0.08)
+        pair_colors = [colors[pair_id % len(colors)]
+                       for pair_id in range(num_chromosomes)] * 2
+
+        if progress > 0.2:  # Separate earlier
+            _draw_separated(ana_centers, ana_angles, ana_lengths, ana_widths, pair_colors)
+        else:
+            _draw_joined(ana_centers, ana_angles, ana_lengths, ana_widths, pair_colors)
+
         # Centrosomes
-        pole_top_pos = (0, pole_top_y)
-        pole_bottom_pos = (0, pole_bottom_y)
-        c1 = Circle(pole_top_pos, 0.1, fill=True, facecolor='red', 
-                   edgecolor='darkred', lw=2, zorder=4)
-        c2 = Circle(pole_bottom_pos, 0.1, fill=True, facecolor='red', 
-                   edgecolor='darkred', lw=2, zorder=4)
-        ax.add_patch(c1)
-        ax.add_patch(c2)
-        centrosomes = [c1, c2]
-    
+        _show_centrosomes((0, pole_top_y), (0, pole_bottom_y), 0.1)
+
     # Telophase
     elif stage_idx == 4:
         progress = min(time / 1.0, 1.0)
-        
+
         # Cell membrane pinching
         pinch = progress * 0.4
-        # Draw two overlapping circles for pinching effect
-        cell_membrane1 = Circle((0, pinch), cell_radius * 0.9, fill=False, 
-                               edgecolor='black', lw=3, zorder=1)
-        cell_membrane2 = Circle((0, -pinch), cell_radius * 0.9, fill=False, 
-                               edgecolor='black', lw=3, zorder=1)
-        ax.add_patch(cell_membrane1)
-        ax.add_patch(cell_membrane2)
-        cell_membrane = [cell_membrane1, cell_membrane2]
-        
+        # Two overlapping circles for pinching effect
+        _place_circle(membrane_a, (0, pinch), cell_radius * 0.9)
+        _place_circle(membrane_b, (0, -pinch), cell_radius * 0.9)
+
         # Chromosomes at poles, decondensing (fading out)
-        pole_top = [0, cell_radius * 0.6]
-        pole_bottom = [0, -cell_radius * 0.6]
-        
+        # Plain tuples: these are only broadcast/unpacked, so there is no
+        # need to allocate 2-element ndarrays for them each frame
+        pole_top = (0.0, cell_radius * 0.6)
+        pole_bottom = (0.0, -cell_radius * 0.6)
+
         # Chromosomes become less visible as they decondense
         fade_progress = 1.0 - progress  # Fade out as telophase progresses
-        
+
         if fade_progress > 0.1:  # Only show if still visible
-            for i in range(num_chromosomes * 2):
-                if i % 2 == 0:
-                    center = pole_top
-                else:
-                    center = pole_bottom
-                
-                # Decondensing (getting smaller and fading)
-                length = 0.15 * fade_progress
-                width = 0.08 * fade_progress
-                chrom = Chromosome(center, np.pi/2, length=length, width=width, 
-                                 color=colors[i // 2 % len(colors)], pair_id=i//2)
-                chrom.is_separated = True
-                chrom.draw(ax)
-                chromosomes.append(chrom)
-        
+            n = num_chromosomes * 2
+            centers = np.empty((n, 2))
+            centers[0::2] = pole_top
+            centers[1::2] = pole_bottom
+            angles = np.full(n, np.pi/2)
+            # Decondensing (getting smaller and fading)
+            lengths = np.full(n, 0.15 * fade_progress)
+            widths = np.full(n, 0.08 * fade_progress)
+            chrom_colors = [colors[i // 2 % len(colors)] for i in range(n)]
+            _draw_separated(centers, angles, lengths, widths, chrom_colors)
+
         # Nuclei reforming (growing)
         nucleus_size = progress * nucleus_radius * 0.7
         if nucleus_size > 0.1:
-            n1 = Circle(tuple(pole_top), nucleus_size, fill=True, facecolor='lightblue', 
-                       edgecolor='darkblue', lw=2, alpha=0.5 + progress * 0.3, zorder=2)
-            n2 = Circle(tuple(pole_bottom), nucleus_size, fill=True, facecolor='lightblue', 
-                       edgecolor='darkblue', lw=2, alpha=0.5 + progress * 0.3, zorder=2)
-            ax.add_patch(n1)
-            ax.add_patch(n2)
-            nucleus = [n1, n2]
-    
+            nucleus_a.set_center(pole_top)
+            nucleus_b.set_center(pole_bottom)
+            for nucleus in (nucleus_a, nucleus_b):
+                nucleus.set_radius(nucleus_size)
+                nucleus.set_alpha(0.5 + progress * 0.3)
+                nucleus.set_visible(True)
+
     # Cytokinesis
     elif stage_idx == 5:
         progress = min(time / 1.0, 1.0)
-        
+
         # Two separate cells (completely separated)
         # Increase separation significantly - start at 0.8 and go to 1.5
         separation = 0.8 + progress * 0.7  # Much more separation
-        cell1 = Circle((0, separation), cell_radius * 0.85, fill=False, 
-                      edgecolor='black', lw=3, zorder=1)
-        cell2 = Circle((0, -separation), cell_radius * 0.85, fill=False, 
-                      edgecolor='black', lw=3, zorder=1)
-        ax.add_patch(cell1)
-        ax.add_patch(cell2)
-        cell_membrane = [cell1, cell2]
-        
+        _place_circle(membrane_a, (0, separation), cell_radius * 0.85)
+        _place_circle(membrane_b, (0, -separation), cell_radius * 0.85)
+
         # Nuclei in each cell (fully formed)
         nucleus_size = nucleus_radius * 0.7
-        n1 = Circle((0, separation), nucleus_size, fill=True, facecolor='lightblue', 
-                   edgecolor='darkblue', lw=2, alpha=0.6, zorder=2)
-        n2 = Circle((0, -separation), nucleus_size, fill=True, facecolor='lightblue', 
-                   edgecolor='darkblue', lw=2, alpha=0.6, zorder=2)
-        ax.add_patch(n1)
-        ax.add_patch(n2)
-        nucleus = [n1, n2]
-        
+        nucleus_a.set_center((0, separation))
+        nucleus_b.set_center((0, -separation))
+        for nucleus in (nucleus_a, nucleus_b):
+            nucleus.set_radius(nucleus_size)
+            nucleus.set_alpha(0.6)
+            nucleus.set_visible(True)
+
         # Chromosomes are completely decondensed (not visible in Cytokinesis)
         # Only show labels
-        text1 = ax.text(0, separation, "Daughter\nCell 1", ha='center', va='center', 
-               fontsize=11, fontweight='bold', zorder=4,
-               bbox=dict(boxstyle="round,pad=0.3", facecolor="white", alpha=0.8))
-        text2 = ax.text(0, -separation, "Daughter\nCell 2", ha='center', va='center', 
-               fontsize=11, fontweight='bold', zorder=4,
-               bbox=dict(boxstyle="round,pad=0.3", facecolor="white", alpha=0.8))
-        text_elements.extend([text1, text2])
-        
+        daughter_texts[0].set_position((0, separation))
+        daughter_texts[1].set_position((0, -separation))
+        for text in daughter_texts:
+            text.set_visible(True)
+
         # No chromosomes, no spindle fibers - just two separate cells
-    
+
     # Update stage label
     stage_label.set_text(f"Stage: {stage_name}")
     
-    # Update info text
-    description = STAGE_DESCRIPTIONS.get(stage_name, "Unknown stage")
-    # Wrap description if too long (manual wrapping)
-    max_desc_len = 32
-    if len(description) > max_desc_len:
-        words = description.split()
-        wrapped_desc = []
-        current_line = ""
-        for word in words:
-            if len(current_line + word + " ") <= max_desc_len:
-                current_line += word + " "
-            else:
-                if current_line:
-                    wrapped_desc.append(current_line.strip())
-                current_line = word + " "
-        if current_line:
-            wrapped_desc.append(current_line.strip())
-        description = "\n".join(wrapped_desc)
-    
-    info_text.set_text(
-        f"MITOSIS SIMULATOR\n"
-        f"{'='*28}\n\n"
-        f"Current Stage: {stage_name}\n"
-        f"Stage {stage_idx + 1} of {len(STAGES)}\n\n"
-        f"Description:\n{description}\n\n"
-        f"Key Features:\n"
-    )
-    
-    if stage_idx == 0:
-        info_text.set_text(info_text.get_text() + 
-            "• Cell growth\n"
-            "• DNA replication\n"
-            "• Preparation for division")
-    elif stage_idx == 1:
-        info_text.set_text(info_text.get_text() + 
-            "• Chromosomes condense\n"
-            "• Nuclear envelope breaks\n"
-            "• Spindle apparatus forms")
-    elif stage_idx == 2:
-        info_text.set_text(info_text.get_text() + 
-            "• Chromosomes align\n"
-            "• At metaphase plate\n"
-            "• Spindle fibers attach")
-    elif stage_idx == 3:
-        info_text.set_text(info_text.get_text() + 
-            "• Sister chromatids separate\n"
-            "• Move to opposite poles\n"
-            "• Cell begins to elongate")
-    elif stage_idx == 4:
-        info_text.set_text(info_text.get_text() + 
-            "• Chromosomes decondense\n"
-            "• Nuclear envelopes reform\n"
-            "• Cell membrane pinches")
-    elif stage_idx == 5:
-        info_text.set_text(info_text.get_text() + 
-            "• Two daughter cells form\n"
-            "• Each with full chromosome set\n"
-            "• Process complete!")
+    # Update info text: one write of the precomputed per-stage string,
+    # so matplotlib lays the text out only once per frame
+    info_text.set_text(_INFO_TEXTS[stage_idx])
 
 # -----------------------------
 # Controls
 # -----------------------------
-# Stage selector (radio buttons)
-ax_stage = plt.axes([0.10, 0.10, 0.55, 0.12])
-stage_radio = RadioButtons(ax_stage, list(STAGES.keys()), active=0)
+# Widgets are only built when running interactively (see _build_ui below);
+# batch rendering via render_frames skips them entirely
+stage_radio = None
+btn_prev = None
+btn_next = None
+btn_animate = None
+btn_reset = None
+speed_slider = None
+
+def _build_ui():
+    """Create the interactive widgets and wire up their callbacks."""
+    global stage_radio, btn_prev, btn_next, btn_animate, btn_reset, speed_slider
 
-# Buttons
-ax_prev = plt.axes([0.10, 0.05, 0.12, 0.04])
-btn_prev = Button(ax_prev, "◄ Previous")
+    # Stage selector (radio buttons)
+    ax_stage = plt.axes([0.10, 0.10, 0.55, 0.12])
+    stage_radio = RadioButtons(ax_stage, list(STAGES.keys()), active=0)
 
-ax_next = plt.axes([0.24, 0.05, 0.12, 0.04])
-btn_next = Button(ax_next, "Next ►")
+    # Buttons
+    ax_prev = plt.axes([0.10, 0.05, 0.12, 0.04])
+    btn_prev = Button(ax_prev, "◄ Previous")
 
-ax_animate = plt.axes([0.38, 0.05, 0.12, 0.04])
-btn_animate = Button(ax_animate, "Animate")
+    ax_next = plt.axes([0.24, 0.05, 0.12, 0.04])
+    btn_next = Button(ax_next, "Next ►")
 
-ax_reset = plt.axes([0.52, 0.05, 0.12, 0.04])
-btn_reset = Button(ax_reset, "Reset")
+    ax_animate = plt.axes([0.38, 0.05, 0.12, 0.04])
+    btn_animate = Button(ax_animate, "Animate")
 
-# Speed slider
-ax_speed = plt.axes([0.70, 0.10, 0.12, 0.03])
-speed_slider = Slider(ax_speed, "Speed", 0.5, 3.0, valinit=1.0, valstep=0.1)
+    ax_reset = plt.axes([0.52, 0.05, 0.12, 0.04])
+    btn_reset = Button(ax_reset, "Reset")
+
+    # Speed slider
+    ax_speed = plt.axes([0.70, 0.10, 0.12, 0.03])
+    speed_slider = Slider(ax_speed, "Speed", 0.5, 3.0, valinit=1.0, valstep=0.1)
+
+    stage_radio.on_clicked(on_stage_select)
+    btn_prev.on_clicked(on_prev)
+    btn_next.on_clicked(on_next)
+    btn_animate.on_clicked(on_animate)
+    btn_reset.on_clicked(on_reset)
+    speed_slider.on_changed(on_speed_change)
 
 # -----------------------------
 # Event handlers
@@ -579,13 +612,11 @@ def on_reset(_):
     # Update radio button
     stage_radio.set_active(0)
     
-    # Clear all elements completely
-    clear_elements()
-    
-    # Reset chromosome states by clearing the list
-    global chromosomes
-    chromosomes = []
-    
+    # Hide all elements completely and force a fresh render
+    hide_all_artists()
+    global _last_render_key
+    _last_render_key = None
+
     # Redraw visualization from scratch
     update_visualization()
     
@@ -596,39 +627,73 @@ def on_reset(_):
 def on_speed_change(val):
     """Handle speed change."""
     state["speed"] = float(val)
-
-stage_radio.on_clicked(on_stage_select)
-btn_prev.on_clicked(on_prev)
-btn_next.on_clicked(on_next)
-btn_animate.on_clicked(on_animate)
-btn_reset.on_clicked(on_reset)
-speed_slider.on_changed(on_speed_change)
+    # Below 1x, slow down by stretching the timer rather than shrinking
+    # the per-tick step (animate holds it at the 1x value): the visual
+    # rate is the same but the event loop wakes proportionally less often
+    if ani is not None:
+        ani.event_source.interval = int(50 / min(state["speed"], 1.0))
 
 # -----------------------------
 # Animation
 # -----------------------------
+def _dynamic_artists():
+    """All artists the animation may mutate, ordered back-to-front for blitting."""
+    return (membrane_a, membrane_b, nucleus_a, nucleus_b,
+            spindle_lc, center_text, centro_col,
+            *daughter_texts, chrom_pc, sep_lc,
+            stage_label, info_text)
+
 def animate(_frame):
     """Animation function."""
     if state["animate"]:
-        state["time"] += 0.02 * state["speed"]
-        
+        # Below 1x the timer interval is stretched instead (see
+        # on_speed_change), so the per-tick step holds at the 1x value
+        # there; wall-clock progress then scales linearly with speed
+        # rather than with speed squared
+        state["time"] += 0.02 * max(state["speed"], 1.0)
+
         # Auto-advance to next stage when current stage completes
         if state["time"] > 1.0:
             state["time"] = 0.0
             if state["stage"] < len(STAGES) - 1:
                 state["stage"] += 1
-                stage_radio.set_active(state["stage"])
+                if stage_radio is not None:
+                    stage_radio.set_active(state["stage"])
             else:
                 state["animate"] = False
-                btn_animate.label.set_text("Animate")
-        
+                if btn_animate is not None:
+                    btn_animate.label.set_text("Animate")
+
         update_visualization()
-    
-    return []
 
-ani = FuncAnimation(fig, animate, interval=50, blit=False, cache_frame_data=False)
+    # With blit=True matplotlib redraws only these artists over a cached
+    # background instead of repainting the whole canvas
+    return _dynamic_artists()
 
-# Initial render
-update_visualization()
-plt.show()
+def render_frames(path, n_frames, speed=1.0):
+    """Render n_frames of the full mitosis animation as numbered PNGs.
+
+    Batch/headless entry point: run under the Agg backend (e.g. with
+    MPLBACKEND=Agg) to skip the GUI event loop and widget construction
+    entirely. Stops early once the animation completes.
+    """
+    state["stage"] = 0
+    state["time"] = 0.0
+    state["speed"] = speed
+    state["animate"] = True
+    for frame in range(n_frames):
+        animate(frame)
+        fig.savefig(f"{path}/frame_{frame:04d}.png")
+        if not state["animate"]:  # animation reached the final stage
+            break
+
+ani = None
+
+if __name__ == "__main__":
+    _build_ui()
+    ani = FuncAnimation(fig, animate, interval=50, blit=True, cache_frame_data=False)
+
+    # Initial render
+    update_visualization()
+    plt.show()
 
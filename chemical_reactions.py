@@ -2,9 +2,17 @@ import numpy as np
 import matplotlib.pyplot as plt
 from matplotlib.widgets import Slider, Button, RadioButtons
 from matplotlib.patches import Circle, FancyArrowPatch, Rectangle
+from matplotlib.collections import EllipseCollection, LineCollection
+from matplotlib.colors import to_rgba
+from matplotlib.transforms import offset_copy
 from matplotlib.animation import FuncAnimation
 import matplotlib.patches as mpatches
 
+try:
+    from numba import njit
+except ImportError:  # numba is optional; fall back to plain NumPy
+    njit = None
+
 # -----------------------------
 # Chemical Reactions Simulator
 # For Junior High School Chemistry
@@ -13,12 +21,23 @@ import matplotlib.patches as mpatches
 # -----------------------------
 # State Management
 # -----------------------------
-state = {
-    "reaction_type": "Combustion",
-    "animation_progress": 0.0,
-    "is_animating": False,
-    "speed": 50
-}
+class _State:
+    """Simulation state.
+
+    A __slots__ class instead of a dict: attribute access is cheaper than
+    dict lookups in the animation callback, and typos raise instead of
+    silently growing the state.
+    """
+    __slots__ = ("reaction_type", "step", "is_animating", "speed", "last_pct")
+
+    def __init__(self):
+        self.reaction_type = "Combustion"
+        self.step = 0  # integer animation step, 0..NUM_STEPS
+        self.is_animating = False
+        self.speed = 50
+        self.last_pct = -1  # progress % currently shown in the info panel
+
+state = _State()
 
 # -----------------------------
 # Reaction Definitions
@@ -70,6 +89,141 @@ ATOM_COLORS = {
     "Na": "#FFA500"  # Orange
 }
 
+# Pre-converted RGBA so matplotlib never has to re-parse the hex strings;
+# the alpha channel of these rows is mutated per frame on the collection
+ATOM_RGBA = {k: np.array(to_rgba(v)) for k, v in ATOM_COLORS.items()}
+_DEFAULT_RGBA = np.array(to_rgba("#CCCCCC"))
+_EDGE_RGBA = np.array(to_rgba("black"))
+
+# -----------------------------
+# Molecule Geometry
+# -----------------------------
+def _geom(atom_types, offsets, radii, bond_pairs, double_pairs=None):
+    """Assemble one molecule geometry entry from its local-space layout.
+
+    double_pairs lists bonds that additionally get a second, parallel
+    stroke; the parallel line is produced at render time by a fixed
+    display-space offset, not by shifting endpoints in data space.
+    """
+    offsets = np.asarray(offsets, dtype=float)
+
+    def _segments(pairs):
+        if pairs:
+            return offsets[np.asarray(pairs, dtype=int)]
+        return np.empty((0, 2, 2))
+
+    return {
+        "atom_types": tuple(atom_types),
+        "offsets": offsets,
+        "radii": np.asarray(radii, dtype=float),
+        "bonds": _segments(bond_pairs),
+        "bonds_double": _segments(double_pairs),
+    }
+
+def _build_geometry():
+    """Precompute atom offsets, radii and bond segments per molecule.
+
+    Everything is in molecule-local coordinates at scale 1.0, so
+    draw_molecule can place a molecule with a single
+    center + scale * offsets broadcast instead of re-deriving each shape
+    (and its trig) from the formula string every frame.
+    """
+    geom = {}
+
+    # Methane - tetrahedral (C in center, 4 H around)
+    angles = np.array([np.pi/2, np.pi/2 + 2*np.pi/3, np.pi/2 + 4*np.pi/3, -np.pi/2])
+    h_offsets = 0.3 * np.stack([np.cos(angles), np.sin(angles)], axis=-1)
+    geom["CH₄"] = _geom(["C", "H", "H", "H", "H"],
+                        np.vstack([[0, 0], h_offsets]),
+                        [0.18, 0.12, 0.12, 0.12, 0.12],
+                        [(0, 1), (0, 2), (0, 3), (0, 4)])
+
+    # Carbon dioxide - linear (O=C=O) with double bonds
+    geom["CO₂"] = _geom(["O", "C", "O"],
+                        [[-0.25, 0], [0, 0], [0.25, 0]],
+                        [0.15, 0.15, 0.15],
+                        [(0, 1), (1, 2)],
+                        double_pairs=[(0, 1), (1, 2)])
+
+    # Water - bent shape (H-O-H)
+    angle1 = np.pi/6  # 30 degrees
+    h_x, h_y = 0.25 * np.cos(angle1), 0.25 * np.sin(angle1)
+    geom["H₂O"] = _geom(["O", "H", "H"],
+                        [[0, 0], [-h_x, -h_y], [h_x, -h_y]],
+                        [0.15, 0.12, 0.12],
+                        [(0, 1), (0, 2)])
+
+    # Hydrogen chloride - linear
+    geom["HCl"] = _geom(["H", "Cl"],
+                        [[-0.2, 0], [0.2, 0]],
+                        [0.12, 0.15],
+                        [(0, 1)])
+
+    # Sodium hydroxide - Na-O-H
+    geom["NaOH"] = _geom(["Na", "O", "H"],
+                         [[-0.3, 0], [0, 0], [0.3, 0]],
+                         [0.15, 0.15, 0.12],
+                         [(0, 1), (1, 2)])
+
+    # Sodium chloride - linear
+    geom["NaCl"] = _geom(["Na", "Cl"],
+                         [[-0.2, 0], [0.2, 0]],
+                         [0.15, 0.15],
+                         [(0, 1)])
+
+    # Diatomic molecules without a hand-tuned layout (e.g. O₂, H₂) get a
+    # generic geometry from _generic_geometry on first use
+    return geom
+
+MOLECULE_GEOM = _build_geometry()
+
+# -----------------------------
+# Animation Easing Tables
+# -----------------------------
+# The animation advances in discrete integer steps, so every easing value
+# (positions and alphas as a function of progress) can be tabulated once at
+# import instead of recomputed every frame. Indexing by step also keeps the
+# progress exact - no float accumulation drift. At the default speed of 50
+# the animation advances 5 steps per frame, matching the old 0.02 increment.
+NUM_STEPS = 250
+STEPS = np.linspace(0.0, 1.0, NUM_STEPS + 1)
+REACTANT_X = -1.4 + 0.4 * STEPS
+REACTANT_ALPHA = np.maximum(0.3, 1.0 - 0.7 * STEPS)
+PRODUCT_X = 0.3 + (1.0 - STEPS) * 0.3 + STEPS * 0.5
+PRODUCT_ALPHA = np.clip((STEPS - 0.3) / 0.4, 0.0, 1.0)
+ARROW_X = -0.1 + 0.2 * STEPS
+ARROW_ALPHA = np.clip((STEPS - 0.1) / 0.3, 0.0, 1.0)
+
+def _generic_geometry(atoms):
+    """Build a fallback geometry for molecules without a hand-tuned layout."""
+    atom_types = [atom_type for atom_type, count in atoms for _ in range(count)]
+    num_atoms = len(atom_types)
+    num_atom_types = len(atoms)
+    bond_pairs = []
+    if num_atoms == 1:
+        # Single atom
+        offsets = [[0.0, 0.0]]
+    elif num_atoms == 2:
+        # Two atoms side by side with a single bond
+        offsets = [[-0.2, 0.0], [0.2, 0.0]]
+        bond_pairs = [(0, 1)]
+    elif num_atoms == 3:
+        if num_atom_types == 2:
+            # Central atom (usually the one with count 1) flanked by the others
+            if atoms[0][1] == 1:
+                atom_types = [atoms[0][0], atoms[1][0], atoms[1][0]]
+            else:
+                atom_types = [atoms[1][0], atoms[0][0], atoms[0][0]]
+            offsets = [[0.0, 0.0], [-0.2, 0.0], [0.2, 0.0]]
+        else:
+            # Triangular arrangement
+            offsets = [[0.0, 0.2], [-0.2, -0.2], [0.2, -0.2]]
+    else:
+        # Multiple atoms (num_atoms > 3) - arrange in a circle
+        angles = np.arange(num_atoms) * (2 * np.pi / num_atoms)
+        offsets = 0.25 * np.stack([np.cos(angles), np.sin(angles)], axis=-1)
+    return _geom(atom_types, offsets, [0.15] * num_atoms, bond_pairs)
+
 # -----------------------------
 # Figure Setup
 # -----------------------------
@@ -80,6 +234,8 @@ fig.suptitle("Chemical Reactions Simulator", fontsize=16, fontweight='bold')
 ax = plt.axes([0.05, 0.15, 0.65, 0.75])
 ax.set_xlim(-2.2, 2.2)
 ax.set_ylim(-1.6, 1.2)
+# Limits are fixed, so never pay for autoscale bookkeeping on artist adds
+ax.set_autoscale_on(False)
 ax.set_aspect('equal')
 ax.axis('off')
 ax.set_facecolor('#F5F5F5')
@@ -114,364 +270,282 @@ btn_reset = Button(ax_reset, 'Reset')
 # -----------------------------
 # Visualization Variables
 # -----------------------------
-molecule_patches = []
-atom_patches = []
-bond_lines = []
-text_elements = []  # Track all text elements (atom labels, molecule labels)
-arrow = None
+sim_artists = []  # Every artist build_artists creates, in creation order
+atom_label_texts = []  # Per-atom symbol Texts, aligned with _ATOM_XY rows
+mol_labels = []  # Per-molecule formula Texts
+mol_label_y = []  # Their fixed y positions (x follows the side easing)
+mol_label_reactant = []  # True for reactant-side molecule labels
+atom_coll = None  # Single EllipseCollection holding every atom circle
+_ATOM_BASE = None  # (N, 2) atom positions at x_pos = 0
+_ATOM_XY = None  # (N, 2) scratch buffer for per-frame offsets
+_ATOM_ALPHA = None  # (N,) scratch buffer for per-frame alphas
+_ATOM_FACE = None  # (N, 4) RGBA facecolors; only column 3 changes per frame
+_ATOM_EDGE = None  # (N, 4) RGBA edgecolors; only column 3 changes per frame
+_ATOM_REACTANT = None  # (N,) True for reactant-side atoms
+bonds_single = None  # LineCollection holding every single-bond stroke
+bonds_double = None  # LineCollection drawing the parallel double-bond stroke
+_BOND_BASE = None  # (B, 2, 2) single-bond segments at x_pos = 0
+_BOND_XY = None  # (B, 2, 2) scratch buffer for per-frame segments
+_BOND_RGBA = None  # (B, 4) stroke colors; only column 3 changes per frame
+_BOND_REACTANT = None  # (B,) True for reactant-side bonds
+_DBL_BASE = None  # (D, 2, 2) double-bond segments at x_pos = 0
+_DBL_XY = None  # (D, 2, 2) scratch buffer for per-frame segments
+_DBL_RGBA = None  # (D, 4) stroke colors; only column 3 changes per frame
+_DBL_REACTANT = None  # (D,) True for reactant-side double bonds
+arrow = None  # Persistent FancyArrowPatch; hidden via alpha 0 until needed
 equation_text = None
+_info_static = ""  # Info-panel text that only changes on reaction change
+_last_drawn_step = None  # step currently reflected by the artists, or None
 
 # -----------------------------
 # Helper Functions
 # -----------------------------
-def draw_atom(center, atom_type, radius=0.15, zorder=3, alpha=1.0):
-    """Draw a single atom."""
-    color = ATOM_COLORS.get(atom_type, "#CCCCCC")
-    circle = Circle(center, radius, facecolor=color, edgecolor='black', 
-                   linewidth=2, zorder=zorder, alpha=alpha)
-    ax.add_patch(circle)
-    # Add atom label
-    text = ax.text(center[0], center[1], atom_type, ha='center', va='center',
-           fontsize=10, fontweight='bold', zorder=zorder+1, alpha=alpha, color='white' if atom_type == 'C' else 'black')
-    text_elements.append(text)
-    return circle
-
-def draw_bond(start, end, zorder=2, alpha=1.0, linewidth=2):
-    """Draw a bond line between two atoms."""
-    from matplotlib.lines import Line2D
-    line = Line2D([start[0], end[0]], [start[1], end[1]], 
-                 color='black', linewidth=int(linewidth), zorder=zorder, alpha=alpha)
-    ax.add_line(line)
-    return line
-
-def draw_molecule(center, molecule, scale=1.0, zorder=2, alpha=1.0):
-    """Draw a molecule with its atoms."""
-    patches = []
-    atoms = molecule["atoms"]
-    color = molecule["color"]
-    formula = molecule["formula"]
-    # Note: bond_lines are managed globally, but we'll track them per molecule call
-    
-    # Special handling for common molecules with proper shapes
-    if formula == "CH₄":
-        # Methane - tetrahedral (C in center, 4 H around)
-        c_center = center
-        patches.append(draw_atom(c_center, "C", radius=0.18*scale, zorder=zorder, alpha=alpha))
-        # 4 H atoms in tetrahedral arrangement
-        h_radius = 0.3 * scale
-        angles = [np.pi/2, np.pi/2 + 2*np.pi/3, np.pi/2 + 4*np.pi/3, -np.pi/2]
-        h_positions = []
-        for angle in angles:
-            h_x = c_center[0] + h_radius * np.cos(angle)
-            h_y = c_center[1] + h_radius * np.sin(angle)
-            h_pos = (h_x, h_y)
-            h_positions.append(h_pos)
-            patches.append(draw_atom(h_pos, "H", radius=0.12*scale, zorder=zorder, alpha=alpha))
-        # Draw bonds from C to each H
-        for h_pos in h_positions:
-            bond_lines.append(draw_bond(c_center, h_pos, zorder=zorder-1, alpha=alpha))
-    elif formula == "CO₂":
-        # Carbon dioxide - linear (O-C-O)
-        offset = 0.25 * scale
-        o1_pos = (center[0] - offset, center[1])
-        c_pos = center
-        o2_pos = (center[0] + offset, center[1])
-        patches.append(draw_atom(o1_pos, "O", radius=0.15*scale, zorder=zorder, alpha=alpha))
-        patches.append(draw_atom(c_pos, "C", radius=0.15*scale, zorder=zorder, alpha=alpha))
-        patches.append(draw_atom(o2_pos, "O", radius=0.15*scale, zorder=zorder, alpha=alpha))
-        # Draw double bonds (two lines for each bond)
-        bond_lines.append(draw_bond(o1_pos, c_pos, zorder=zorder-1, alpha=alpha))
-        bond_lines.append(draw_bond(c_pos, o2_pos, zorder=zorder-1, alpha=alpha))
-        # Draw second line for double bonds (slightly offset)
-        offset_line = 0.03 * scale
-        bond_lines.append(draw_bond((o1_pos[0], o1_pos[1] + offset_line), 
-                                    (c_pos[0], c_pos[1] + offset_line), zorder=zorder-1, alpha=alpha, linewidth=2))
-        bond_lines.append(draw_bond((c_pos[0], c_pos[1] + offset_line), 
-                                    (o2_pos[0], o2_pos[1] + offset_line), zorder=zorder-1, alpha=alpha, linewidth=2))
-    elif formula == "H₂O":
-        # Water - bent shape (H-O-H)
-        o_center = center
-        patches.append(draw_atom(o_center, "O", radius=0.15*scale, zorder=zorder, alpha=alpha))
-        # Two H atoms at angle
-        h_offset = 0.25 * scale
-        angle1 = np.pi/6  # 30 degrees
-        h1_pos = (o_center[0] - h_offset*np.cos(angle1), o_center[1] - h_offset*np.sin(angle1))
-        h2_pos = (o_center[0] + h_offset*np.cos(angle1), o_center[1] - h_offset*np.sin(angle1))
-        patches.append(draw_atom(h1_pos, "H", radius=0.12*scale, zorder=zorder, alpha=alpha))
-        patches.append(draw_atom(h2_pos, "H", radius=0.12*scale, zorder=zorder, alpha=alpha))
-        # Draw bonds from O to each H
-        bond_lines.append(draw_bond(o_center, h1_pos, zorder=zorder-1, alpha=alpha))
-        bond_lines.append(draw_bond(o_center, h2_pos, zorder=zorder-1, alpha=alpha))
-    elif formula == "HCl":
-        # Hydrogen chloride - linear
-        offset = 0.2 * scale
-        h_pos = (center[0] - offset, center[1])
-        cl_pos = (center[0] + offset, center[1])
-        patches.append(draw_atom(h_pos, "H", radius=0.12*scale, zorder=zorder, alpha=alpha))
-        patches.append(draw_atom(cl_pos, "Cl", radius=0.15*scale, zorder=zorder, alpha=alpha))
-        # Draw bond
-        bond_lines.append(draw_bond(h_pos, cl_pos, zorder=zorder-1, alpha=alpha))
-    elif formula == "NaOH":
-        # Sodium hydroxide - Na-O-H
-        offset = 0.2 * scale
-        na_pos = (center[0] - offset*1.5, center[1])
-        o_pos = center
-        h_pos = (center[0] + offset*1.5, center[1])
-        patches.append(draw_atom(na_pos, "Na", radius=0.15*scale, zorder=zorder, alpha=alpha))
-        patches.append(draw_atom(o_pos, "O", radius=0.15*scale, zorder=zorder, alpha=alpha))
-        patches.append(draw_atom(h_pos, "H", radius=0.12*scale, zorder=zorder, alpha=alpha))
-        # Draw bonds
-        bond_lines.append(draw_bond(na_pos, o_pos, zorder=zorder-1, alpha=alpha))
-        bond_lines.append(draw_bond(o_pos, h_pos, zorder=zorder-1, alpha=alpha))
-    elif formula == "NaCl":
-        # Sodium chloride - linear
-        offset = 0.2 * scale
-        na_pos = (center[0] - offset, center[1])
-        cl_pos = (center[0] + offset, center[1])
-        patches.append(draw_atom(na_pos, "Na", radius=0.15*scale, zorder=zorder, alpha=alpha))
-        patches.append(draw_atom(cl_pos, "Cl", radius=0.15*scale, zorder=zorder, alpha=alpha))
-        # Draw bond
-        bond_lines.append(draw_bond(na_pos, cl_pos, zorder=zorder-1, alpha=alpha))
-    else:
-        # Generic molecule drawing
-        # Calculate positions for atoms in molecule
-        num_atoms = sum(count for _, count in atoms)
-        num_atom_types = len(atoms)
-        
-        if num_atoms == 1:
-            # Single atom
-            atom_type, count = atoms[0]
-            patches.append(draw_atom(center, atom_type, radius=0.15*scale, zorder=zorder, alpha=alpha))
-        elif num_atoms == 2:
-            if num_atom_types == 1:
-                # Two atoms of same type (e.g., O₂) - side by side
-                atom_type, count = atoms[0]
-                offset = 0.2 * scale
-                pos1 = (center[0] - offset, center[1])
-                pos2 = (center[0] + offset, center[1])
-                patches.append(draw_atom(pos1, atom_type, 
-                                         radius=0.15*scale, zorder=zorder, alpha=alpha))
-                patches.append(draw_atom(pos2, atom_type, 
-                                         radius=0.15*scale, zorder=zorder, alpha=alpha))
-                # Draw bond
-                bond_lines.append(draw_bond(pos1, pos2, zorder=zorder-1, alpha=alpha))
-            else:
-                # Two different atoms - side by side
-                atom1_type, atom1_count = atoms[0]
-                atom2_type, atom2_count = atoms[1]
-                offset = 0.2 * scale
-                pos1 = (center[0] - offset, center[1])
-                pos2 = (center[0] + offset, center[1])
-                patches.append(draw_atom(pos1, atom1_type, 
-                                         radius=0.15*scale, zorder=zorder, alpha=alpha))
-                patches.append(draw_atom(pos2, atom2_type, 
-                                         radius=0.15*scale, zorder=zorder, alpha=alpha))
-                # Draw bond
-                bond_lines.append(draw_bond(pos1, pos2, zorder=zorder-1, alpha=alpha))
-        elif num_atoms == 3:
-            if num_atom_types == 1:
-                # Three atoms of same type - triangular
-                atom_type, count = atoms[0]
-                offset = 0.2 * scale
-                patches.append(draw_atom((center[0], center[1] + offset), atom_type, 
-                                         radius=0.15*scale, zorder=zorder, alpha=alpha))
-                patches.append(draw_atom((center[0] - offset, center[1] - offset), atom_type, 
-                                         radius=0.15*scale, zorder=zorder, alpha=alpha))
-                patches.append(draw_atom((center[0] + offset, center[1] - offset), atom_type, 
-                                         radius=0.15*scale, zorder=zorder, alpha=alpha))
-            elif num_atom_types == 2:
-                # Two types, three atoms - triangular with central atom
-                atom1_type, atom1_count = atoms[0]
-                atom2_type, atom2_count = atoms[1]
-                offset = 0.2 * scale
-                # Central atom (usually the one with count 1)
-                if atom1_count == 1:
-                    patches.append(draw_atom(center, atom1_type, radius=0.15*scale, zorder=zorder, alpha=alpha))
-                    patches.append(draw_atom((center[0] - offset, center[1]), atom2_type, 
-                                             radius=0.15*scale, zorder=zorder, alpha=alpha))
-                    patches.append(draw_atom((center[0] + offset, center[1]), atom2_type, 
-                                             radius=0.15*scale, zorder=zorder, alpha=alpha))
-                else:
-                    patches.append(draw_atom(center, atom2_type, radius=0.15*scale, zorder=zorder, alpha=alpha))
-                    patches.append(draw_atom((center[0] - offset, center[1]), atom1_type, 
-                                             radius=0.15*scale, zorder=zorder, alpha=alpha))
-                    patches.append(draw_atom((center[0] + offset, center[1]), atom1_type, 
-                                             radius=0.15*scale, zorder=zorder, alpha=alpha))
-            else:
-                # Three different atoms - triangular
-                atom1_type, atom1_count = atoms[0]
-                atom2_type, atom2_count = atoms[1]
-                atom3_type, atom3_count = atoms[2]
-                offset = 0.2 * scale
-                patches.append(draw_atom((center[0], center[1] + offset), atom1_type, 
-                                         radius=0.15*scale, zorder=zorder, alpha=alpha))
-                patches.append(draw_atom((center[0] - offset, center[1] - offset), atom2_type, 
-                                         radius=0.15*scale, zorder=zorder, alpha=alpha))
-                patches.append(draw_atom((center[0] + offset, center[1] - offset), atom3_type, 
-                                         radius=0.15*scale, zorder=zorder, alpha=alpha))
+def _frame_atoms_kernel(base, is_reactant, x_r, x_p, alpha_r, alpha_p,
+                        out_xy, out_alpha):
+    """Per-frame atom placement: shift each base x by its side's easing.
+
+    Written as an explicit loop so numba can compile it to one pass; the
+    pure-Python fallback is still just a short loop over ~20 atoms.
+    """
+    for i in range(base.shape[0]):
+        if is_reactant[i]:
+            out_xy[i, 0] = base[i, 0] + x_r
+            out_alpha[i] = alpha_r
         else:
-            # Multiple atoms (num_atoms > 3) - arrange in a circle
-            angle_step = 2 * np.pi / num_atoms
-            radius_offset = 0.25 * scale
-            idx = 0
-            for atom_type, count in atoms:
-                for _ in range(count):
-                    angle = idx * angle_step
-                    x = center[0] + radius_offset * np.cos(angle)
-                    y = center[1] + radius_offset * np.sin(angle)
-                    patches.append(draw_atom((x, y), atom_type, radius=0.15*scale, zorder=zorder, alpha=alpha))
-                    idx += 1
-    
-    # Add molecule label - position below molecule with better spacing
-    label_text = ax.text(center[0], center[1] - 0.5*scale, formula, ha='center', va='top',
-           fontsize=11, fontweight='bold', color=color, zorder=zorder+1, alpha=alpha)
-    text_elements.append(label_text)
-    
-    return patches
+            out_xy[i, 0] = base[i, 0] + x_p
+            out_alpha[i] = alpha_p
+        out_xy[i, 1] = base[i, 1]
+
+if njit is not None:
+    _frame_atoms_kernel = njit(cache=True, fastmath=True)(_frame_atoms_kernel)
+
+def draw_atom_label(center, atom_type, zorder=3):
+    """Draw the text label for a single atom.
+
+    Artists are built fully opaque; fading is applied per frame through
+    set_alpha, never by rebuilding.
+    """
+    text = ax.text(center[0], center[1], atom_type, ha='center', va='center',
+           fontsize=10, fontweight='bold', zorder=zorder, color='white' if atom_type == 'C' else 'black')
+    sim_artists.append(text)
+    return text
 
 def clear_visualization():
-    """Clear all visual elements."""
-    global molecule_patches, atom_patches, bond_lines, text_elements, arrow, equation_text
-    
-    # Clear molecules (patches)
-    for patch_list in molecule_patches:
-        if isinstance(patch_list, list):
-            for patch in patch_list:
-                try:
-                    patch.remove()
-                except (ValueError, AttributeError):
-                    pass
-        else:
-            try:
-                patch_list.remove()
-            except (ValueError, AttributeError):
-                pass
-    molecule_patches = []
-    atom_patches = []
-    
-    # Clear bonds
-    for bond in bond_lines:
-        try:
-            bond.remove()
-        except (ValueError, AttributeError):
-            pass
-    bond_lines = []
-    
-    # Clear all text elements (atom labels, molecule labels)
-    for text in text_elements:
-        try:
-            text.remove()
-        except (ValueError, AttributeError):
-            pass
-    text_elements = []
-    
-    # Clear arrow
-    if arrow is not None:
-        try:
-            arrow.remove()
-        except (ValueError, AttributeError):
-            pass
-        arrow = None
-    
-    # Clear equation text
-    if equation_text is not None:
-        try:
-            equation_text.remove()
-        except (ValueError, AttributeError):
-            pass
-        equation_text = None
+    """Remove every simulation artist ahead of a rebuild.
 
-def draw_reaction():
-    """Draw the chemical reaction visualization."""
+    Artist creation and removal both go through sim_artists, so a plain
+    remove() is always valid here - no defensive try/except needed.
+    """
+    global arrow, equation_text, atom_coll, bonds_single, bonds_double
+    for artist in sim_artists:
+        artist.remove()
+    sim_artists.clear()
+    atom_label_texts.clear()
+    mol_labels.clear()
+    mol_label_y.clear()
+    mol_label_reactant.clear()
+    atom_coll = None
+    bonds_single = None
+    bonds_double = None
+    arrow = None
+    equation_text = None
+
+def build_artists():
+    """Create the persistent artists for the current reaction.
+
+    Called once per reaction change (not per frame); draw_reaction then
+    animates everything purely through in-place mutation.
+    """
+    global equation_text, atom_coll, _ATOM_BASE, _ATOM_XY, _ATOM_ALPHA, _ATOM_REACTANT
+    global _ATOM_FACE, _ATOM_EDGE, _info_static
+    global bonds_single, bonds_double, _BOND_BASE, _BOND_XY, _BOND_RGBA, _BOND_REACTANT
+    global _DBL_BASE, _DBL_XY, _DBL_RGBA, _DBL_REACTANT, arrow
     clear_visualization()
-    
-    reaction = REACTIONS[state["reaction_type"]]
-    progress = state["animation_progress"]
-    
-    # Calculate total number of reactant molecules (including counts)
-    reactants = reaction["reactants"]
-    total_reactant_molecules = sum(reactant.get("count", 1) for reactant in reactants)
-    
-    # Calculate total number of product molecules (including counts)
-    products = reaction["products"]
-    total_product_molecules = sum(product.get("count", 1) for product in products)
-    
+
+    global _last_drawn_step
+    _last_drawn_step = None  # new artists: force the next draw through
+
+    reaction = REACTIONS[state.reaction_type]
+    _info_static = _build_info_static(reaction)
+    state.last_pct = -1  # force an info-panel refresh on the next draw
+
     # Better spacing: distribute molecules evenly in vertical space
-    # Use more vertical space (from 0.8 to -0.8) for better separation
-    reactant_y_start = 0.8
-    reactant_y_end = -0.3
-    product_y_start = 0.8
-    product_y_end = -0.3
-    
-    # Draw reactants on the left
-    molecule_idx = 0
-    for i, reactant in enumerate(reactants):
-        count = reactant.get("count", 1)
-        # Smooth movement: start at left, move toward center
-        x_pos = -1.4 + progress * 0.4
-        
-        # Fade out reactants as they move
-        alpha = max(0.3, 1.0 - progress * 0.7)
-        
-        for j in range(count):
-            # Better vertical distribution
-            if total_reactant_molecules > 1:
-                y_pos = reactant_y_start - (molecule_idx / (total_reactant_molecules - 1)) * (reactant_y_start - reactant_y_end)
-            else:
-                y_pos = (reactant_y_start + reactant_y_end) / 2
-            
-            patches = draw_molecule((x_pos, y_pos), reactant, scale=0.75, alpha=alpha)
-            molecule_patches.append(patches)
-            molecule_idx += 1
-    
-    # Draw arrow - appears as reaction progresses
-    arrow_x = -0.1 + progress * 0.2
-    global arrow
-    if progress > 0.1:
-        arrow_alpha = min(1.0, (progress - 0.1) / 0.3)
-        arrow = FancyArrowPatch((arrow_x - 0.4, 0.25), (arrow_x + 0.4, 0.25),
-                               arrowstyle='->', mutation_scale=30, 
-                               color='black', linewidth=3, zorder=4, alpha=arrow_alpha)
-        ax.add_patch(arrow)
-    
-    # Draw products on the right - fade in as reaction progresses
-    molecule_idx = 0
-    for i, product in enumerate(products):
-        count = product.get("count", 1)
-        # Start from center, move to right
-        x_pos = 0.3 + (1 - progress) * 0.3 + progress * 0.5
-        
-        # Fade in products as reaction progresses
-        alpha = min(1.0, max(0.0, (progress - 0.3) / 0.4))
-        
-        for j in range(count):
-            # Better vertical distribution
-            if total_product_molecules > 1:
-                y_pos = product_y_start - (molecule_idx / (total_product_molecules - 1)) * (product_y_start - product_y_end)
-            else:
-                y_pos = (product_y_start + product_y_end) / 2
-            
-            patches = draw_molecule((x_pos, y_pos), product, scale=0.75, alpha=alpha)
-            molecule_patches.append(patches)
-            molecule_idx += 1
-    
+    y_start = 0.8
+    y_end = -0.3
+    scale = 0.75
+
+    # Structure-of-arrays layout for all atom circles across every molecule,
+    # so one EllipseCollection (and one set_offsets per frame) covers them all
+    atom_types_all = []
+    atom_base = []
+    atom_diameters = []
+    atom_is_reactant = []
+    bond_base = []
+    bond_is_reactant = []
+    dbl_base = []
+    dbl_is_reactant = []
+
+    for side, molecules in (("reactant", reaction["reactants"]),
+                            ("product", reaction["products"])):
+        # Flatten molecule list, expanding counts (e.g. 2H₂O → two slots)
+        flat = [mol for mol in molecules for _ in range(mol.get("count", 1))]
+        total = len(flat)
+        # Vertical distribution in one shot instead of per-molecule arithmetic
+        if total > 1:
+            y_positions = np.linspace(y_start, y_end, total)
+        else:
+            y_positions = np.array([(y_start + y_end) / 2])
+        for molecule, y_pos in zip(flat, y_positions):
+            formula = molecule["formula"]
+            geom = MOLECULE_GEOM.get(formula)
+            if geom is None:
+                # First time we see this formula: derive a layout and cache it
+                geom = MOLECULE_GEOM.setdefault(formula, _generic_geometry(molecule["atoms"]))
+
+            # Geometry at x_pos = 0; draw_reaction shifts x per frame
+            base = np.array([0.0, y_pos]) + scale * geom["offsets"]
+            atom_base.append(base)
+            atom_diameters.extend(2.0 * scale * geom["radii"])
+            atom_types_all.extend(geom["atom_types"])
+            atom_is_reactant.extend([side == "reactant"] * len(geom["atom_types"]))
+
+            # Symbol Texts in the same order as the collection offsets, so
+            # the per-frame update can walk _ATOM_XY and the labels together
+            atom_label_texts.extend(draw_atom_label(pos, atom_type)
+                                    for pos, atom_type in zip(base, geom["atom_types"]))
+            for kind, segs_out, mask_out in (("bonds", bond_base, bond_is_reactant),
+                                             ("bonds_double", dbl_base, dbl_is_reactant)):
+                segs = np.array([0.0, y_pos]) + scale * geom[kind]
+                if len(segs):
+                    segs_out.append(segs)
+                    mask_out.extend([side == "reactant"] * len(segs))
+            # Molecule label - position below molecule with better spacing
+            label = ax.text(0.0, y_pos - 0.5 * scale, formula, ha='center', va='top',
+                            fontsize=11, fontweight='bold', color=molecule["color"], zorder=3)
+            sim_artists.append(label)
+            mol_labels.append(label)
+            mol_label_y.append(y_pos - 0.5 * scale)
+            mol_label_reactant.append(side == "reactant")
+
+    _ATOM_BASE = np.vstack(atom_base)
+    _ATOM_XY = _ATOM_BASE.copy()
+    _ATOM_ALPHA = np.empty(len(_ATOM_BASE))
+    _ATOM_REACTANT = np.array(atom_is_reactant)
+    _ATOM_FACE = np.stack([ATOM_RGBA.get(t, _DEFAULT_RGBA) for t in atom_types_all])
+    _ATOM_EDGE = np.tile(_EDGE_RGBA, (len(atom_types_all), 1))
+    diameters = np.asarray(atom_diameters)
+    atom_coll = EllipseCollection(
+        widths=diameters, heights=diameters, angles=0, units='xy',
+        offsets=_ATOM_XY, offset_transform=ax.transData,
+        facecolors=_ATOM_FACE, edgecolors=_ATOM_EDGE,
+        linewidths=2, zorder=2)
+    ax.add_collection(atom_coll, autolim=False)
+    sim_artists.append(atom_coll)
+
+    # All bond strokes in two LineCollections: one for single bonds, one
+    # for the parallel second stroke of double bonds. The double stroke is
+    # the same base segments shifted a fixed 2.5 points in display space,
+    # so its spacing is stable regardless of scale or zoom.
+    _BOND_BASE = np.concatenate(bond_base) if bond_base else np.empty((0, 2, 2))
+    _BOND_XY = _BOND_BASE.copy()
+    _BOND_REACTANT = np.array(bond_is_reactant, dtype=bool)
+    _BOND_RGBA = np.tile(_EDGE_RGBA, (len(_BOND_BASE), 1))
+    bonds_single = LineCollection(_BOND_XY, colors=_BOND_RGBA, linewidths=2, zorder=1)
+    ax.add_collection(bonds_single, autolim=False)
+    sim_artists.append(bonds_single)
+
+    _DBL_BASE = np.concatenate(dbl_base) if dbl_base else np.empty((0, 2, 2))
+    _DBL_XY = _DBL_BASE.copy()
+    _DBL_REACTANT = np.array(dbl_is_reactant, dtype=bool)
+    _DBL_RGBA = np.tile(_EDGE_RGBA, (len(_DBL_BASE), 1))
+    bonds_double = LineCollection(_DBL_XY, colors=_DBL_RGBA, linewidths=2, zorder=1)
+    bonds_double.set_transform(offset_copy(ax.transData, fig, 0, 2.5, units='points'))
+    ax.add_collection(bonds_double, autolim=False)
+    sim_artists.append(bonds_double)
+
+    # Reaction arrow, created once and hidden until progress reveals it
+    arrow = FancyArrowPatch((-0.5, 0.25), (0.3, 0.25),
+                            arrowstyle='->', mutation_scale=30,
+                            color='black', linewidth=3, zorder=4)
+    arrow.set_alpha(0.0)
+    ax.add_patch(arrow)
+    sim_artists.append(arrow)
+
     # Draw equation - position it lower to avoid overlap
-    global equation_text
     equation_text = ax.text(0, -1.35, reaction["equation"], ha='center', va='center',
                            fontsize=14, fontweight='bold', zorder=5,
                            bbox=dict(boxstyle="round,pad=0.5", facecolor="yellow", alpha=0.8))
-    
+    sim_artists.append(equation_text)
+
+def draw_reaction():
+    """Update the reaction visualization for the current progress."""
+    global _last_drawn_step
+    if atom_coll is None:
+        build_artists()
+
+    step = state.step
+    # The artists already reflect this step - nothing to mutate
+    if step == _last_drawn_step:
+        return
+    _last_drawn_step = step
+
+    # Slide every atom circle at once through the shared buffers
+    _frame_atoms_kernel(_ATOM_BASE, _ATOM_REACTANT,
+                        REACTANT_X[step], PRODUCT_X[step],
+                        REACTANT_ALPHA[step], PRODUCT_ALPHA[step],
+                        _ATOM_XY, _ATOM_ALPHA)
+    atom_coll.set_offsets(_ATOM_XY)
+    # Fade by mutating only the alpha channel of the cached RGBA arrays
+    _ATOM_FACE[:, 3] = _ATOM_ALPHA
+    _ATOM_EDGE[:, 3] = _ATOM_ALPHA
+    atom_coll.set_facecolors(_ATOM_FACE)
+    atom_coll.set_edgecolors(_ATOM_EDGE)
+
+    # Same treatment for the bond collections
+    for base, xy, mask, rgba, coll in (
+            (_BOND_BASE, _BOND_XY, _BOND_REACTANT, _BOND_RGBA, bonds_single),
+            (_DBL_BASE, _DBL_XY, _DBL_REACTANT, _DBL_RGBA, bonds_double)):
+        if not len(base):
+            continue
+        np.copyto(xy, base)
+        xy[mask, :, 0] += REACTANT_X[step]
+        xy[~mask, :, 0] += PRODUCT_X[step]
+        coll.set_segments(xy)
+        rgba[:, 3] = np.where(mask, REACTANT_ALPHA[step], PRODUCT_ALPHA[step])
+        coll.set_color(rgba)
+
+    # Atom symbols ride along with their circles: the collection buffers
+    # already hold the exact positions and alphas
+    for text, pos, a in zip(atom_label_texts, _ATOM_XY, _ATOM_ALPHA):
+        text.set_position((pos[0], pos[1]))
+        text.set_alpha(a)
+
+    # Molecule formula labels track their side's x easing at a fixed y
+    x_r, x_p = REACTANT_X[step], PRODUCT_X[step]
+    a_r, a_p = REACTANT_ALPHA[step], PRODUCT_ALPHA[step]
+    for text, y_pos, is_reactant in zip(mol_labels, mol_label_y, mol_label_reactant):
+        text.set_position((x_r if is_reactant else x_p, y_pos))
+        text.set_alpha(a_r if is_reactant else a_p)
+
+    # Arrow - appears as reaction progresses; mutate, never recreate
+    if step > 0.1 * NUM_STEPS:
+        arrow_x = ARROW_X[step]
+        arrow.set_positions((arrow_x - 0.4, 0.25), (arrow_x + 0.4, 0.25))
+        arrow.set_alpha(ARROW_ALPHA[step])
+    else:
+        arrow.set_alpha(0.0)
+
     # Update info panel
-    update_info_panel(reaction)
+    update_info_panel()
 
-def update_info_panel(reaction):
-    """Update the information panel."""
+def _build_info_static(reaction):
+    """Build the info-panel text that is fixed for a given reaction."""
     info = f"""
 ╔═══════════════════════════════╗
 ║  CHEMICAL REACTION INFO       ║
 ╚═══════════════════════════════╝
 
-Reaction Type: {state["reaction_type"]}
+Reaction Type: {state.reaction_type}
 
 Equation:
 {reaction["equation"]}
@@ -485,62 +559,141 @@ Reactants:
         count = reactant.get("count", 1)
         count_str = f"{count}× " if count > 1 else ""
         info += f"  {count_str}{reactant['formula']} - {reactant['name']}\n"
-    
+
     info += "\nProducts:\n"
     for product in reaction["products"]:
         count = product.get("count", 1)
         count_str = f"{count}× " if count > 1 else ""
         info += f"  {count_str}{product['formula']} - {product['name']}\n"
-    
-    info += f"\nProgress: {int(state['animation_progress'] * 100)}%"
-    
-    info_text.set_text(info)
+
+    return info
+
+def update_info_panel():
+    """Update the information panel.
+
+    Only the progress percentage varies between frames, so the panel text
+    (and its layout pass) is rebuilt only when that integer changes.
+    """
+    pct = state.step * 100 // NUM_STEPS
+    if pct == state.last_pct:
+        return
+    state.last_pct = pct
+    info_text.set_text(_info_static + f"\nProgress: {pct}%")
 
 # -----------------------------
 # Animation
 # -----------------------------
 animation = None
+_restore_timer = None
+
+def _dynamic_artists():
+    """Artists that change from frame to frame.
+
+    Returning these from animate lets FuncAnimation's blit path cache the
+    static background (equation box, axes, info frame) with
+    copy_from_bbox/restore_region internally and recomposite only the
+    moving molecules each tick.
+    """
+    artists = []
+    if atom_coll is not None:
+        artists.append(atom_coll)
+    if bonds_single is not None:
+        artists.append(bonds_single)
+        artists.append(bonds_double)
+    artists.extend(atom_label_texts)
+    artists.extend(mol_labels)
+    if arrow is not None:
+        artists.append(arrow)
+    artists.append(info_text)
+    return artists
+
+def _finish_animation():
+    """Slow path: the run reached 100%; stop the timer and reset the button."""
+    global animation, _restore_timer
+    state.is_animating = False
+    btn_animate.label.set_text("Animate")
+    if animation is not None:
+        try:
+            animation.event_source.stop()
+        except AttributeError:
+            pass
+        animation = None
+    # _restore_static_draw cannot run here: this is called from inside
+    # the animate tick, and FuncAnimation re-marks every returned artist
+    # animated right after the callback returns, which would leave the
+    # finished scene blank on the next full redraw.  A single-shot timer
+    # restores the flags once the final tick is completely done.
+    _restore_timer = fig.canvas.new_timer(interval=0)
+    _restore_timer.single_shot = True
+    _restore_timer.add_callback(_restore_static_draw)
+    _restore_timer.start()
 
 def animate(frame):
-    """Animation function."""
-    if state["is_animating"]:
-        state["animation_progress"] += 0.02 * (state["speed"] / 50)
-        if state["animation_progress"] >= 1.0:
-            state["animation_progress"] = 1.0
-            state["is_animating"] = False
-            btn_animate.label.set_text("Animate")
-            if animation is not None:
-                try:
-                    animation.event_source.stop()
-                except AttributeError:
-                    pass
+    """Animation tick: advance the step and mutate the scene in place."""
+    s = state  # hoist the global; the tick path touches it several times
+    if s.is_animating:
+        # speed is a multiple of 10, so this advance is exact
+        step = s.step + int(s.speed) // 10
+        if step >= NUM_STEPS:
+            s.step = NUM_STEPS
+            _finish_animation()
+        else:
+            s.step = step
         draw_reaction()
-    return []
+    return _dynamic_artists()
+
+def _restore_static_draw():
+    """Re-enable normal drawing for blit-animated artists and refresh once.
+
+    FuncAnimation marks the returned artists animated while blitting;
+    without resetting the flag they would vanish from ordinary redraws
+    after the animation stops.
+    """
+    for artist in _dynamic_artists():
+        artist.set_animated(False)
+    fig.canvas.draw_idle()
 
 # -----------------------------
 # Event Handlers
 # -----------------------------
 def on_reaction_change(label):
     """Handle reaction type change."""
-    state["reaction_type"] = label
-    state["animation_progress"] = 0.0
-    state["is_animating"] = False
+    global animation
+    state.reaction_type = label
+    state.step = 0
+    state.is_animating = False
+    # Stop and discard any running animation before rebuilding: a live
+    # ticker would keep restoring the old reaction's blit background
+    # over the new scene, and the old artists would stay flagged
+    # animated with nothing left to composite them
+    if animation is not None:
+        try:
+            animation.event_source.stop()
+        except AttributeError:
+            pass
+        animation = None
+    for artist in _dynamic_artists():
+        artist.set_animated(False)
+    btn_animate.label.set_text("Animate")
+    build_artists()
     draw_reaction()
+    fig.canvas.draw_idle()
 
 def on_speed_change(val):
     """Handle speed slider change."""
-    state["speed"] = val
+    state.speed = val
 
 def on_animate(_):
     """Toggle animation."""
     global animation
-    state["is_animating"] = not state["is_animating"]
+    state.is_animating = not state.is_animating
     
-    if state["is_animating"]:
+    if state.is_animating:
+        # No draw_idle here: FuncAnimation owns the redraws while running
         btn_animate.label.set_text("Stop")
         if animation is None:
-            animation = FuncAnimation(fig, animate, interval=50, 
-                                     blit=False, cache_frame_data=False)
+            animation = FuncAnimation(fig, animate, interval=50,
+                                     blit=True, cache_frame_data=False)
     else:
         btn_animate.label.set_text("Animate")
         if animation is not None:
@@ -549,13 +702,13 @@ def on_animate(_):
             except AttributeError:
                 pass
             animation = None
-    fig.canvas.draw_idle()
+        _restore_static_draw()
 
 def on_reset(_):
     """Reset to initial state."""
     global animation
-    state["animation_progress"] = 0.0
-    state["is_animating"] = False
+    state.step = 0
+    state.is_animating = False
     if animation is not None:
         try:
             animation.event_source.stop()
@@ -563,9 +716,8 @@ def on_reset(_):
             pass
         animation = None
     btn_animate.label.set_text("Animate")
-    clear_visualization()
     draw_reaction()
-    fig.canvas.draw_idle()
+    _restore_static_draw()
 
 # Wire up events
 reaction_radio.on_clicked(on_reaction_change)
@@ -574,6 +726,7 @@ btn_animate.on_clicked(on_animate)
 btn_reset.on_clicked(on_reset)
 
 # Initial visualization
+build_artists()
 draw_reaction()
 plt.show()
 
@@ -1,3 +1,5 @@
+import math
+
 import numpy as np
 import matplotlib.pyplot as plt
 from matplotlib.widgets import Slider, RadioButtons, Button
@@ -18,6 +20,103 @@ FUNCTION_TYPES = {
     "Sine": "y = a·sin(bx + c) + d"
 }
 
+# Curve sampling density. 250 points is plenty for a few-hundred-pixel
+# wide line; branches with sharp or oscillating features refine locally.
+N_SAMPLES = 250
+
+# The default sampling grid never changes between updates; build it once.
+# (The Exponential and Sine branches derive their grids from slider
+# values, so those stay per-update.)
+_X = np.linspace(-10, 10, N_SAMPLES)
+
+# Info-panel templates, composed once at import. update_graph() only has
+# to .format() the numbers in instead of re-building ~20-line f-strings
+# on every update.
+SEP = "=" * 28
+
+LINEAR_INFO_FMT = (
+    "LINEAR FUNCTION\n"
+    + SEP + "\n\n"
+    "Equation: {equation}\n\n"
+    "Parameters:\n"
+    "  m (slope) = {m:.2f}\n"
+    "    • Positive = rises\n"
+    "    • Negative = falls\n"
+    "    • Steeper = larger |m|\n\n"
+    "  b (y-intercept) = {b:.2f}\n"
+    "    • Where line crosses y-axis\n\n"
+    "Key Points:\n"
+    "  Y-intercept: (0, {b:.2f})\n"
+)
+
+QUADRATIC_INFO_FMT = (
+    "QUADRATIC FUNCTION\n"
+    + SEP + "\n\n"
+    "Equation: {equation}\n\n"
+    "Parameters:\n"
+    "  a = {a:.2f}\n"
+    "    • a > 0: Opens UP (U-shape)\n"
+    "    • a < 0: Opens DOWN (∩-shape)\n"
+    "    • |a| larger = narrower\n\n"
+    "  b = {m:.2f}\n"
+    "    • Affects horizontal position\n\n"
+    "  c = {b:.2f}\n"
+    "    • Y-intercept\n\n"
+    "Key Points:\n"
+    "  Vertex: ({vertex_x:.2f}, {vertex_y:.2f})\n"
+    "  Y-intercept: (0, {b:.2f})\n"
+)
+
+EXPONENTIAL_INFO_FMT = (
+    "EXPONENTIAL FUNCTION\n"
+    + SEP + "\n\n"
+    "Equation: {equation}\n\n"
+    "Parameters:\n"
+    "  a = {a:.2f}\n"
+    "    • Vertical stretch\n\n"
+    "  Base = {b_exp:.2f}\n"
+    "    • b > 1: Grows\n"
+    "    • 0 < b < 1: Decays\n\n"
+    "  c = {c:.2f}\n"
+    "    • Vertical shift\n\n"
+    "Key Points:\n"
+    "  Y-intercept: (0, {y0:.2f})\n"
+)
+
+ABSOLUTE_INFO_FMT = (
+    "ABSOLUTE VALUE FUNCTION\n"
+    + SEP + "\n\n"
+    "Equation: {equation}\n\n"
+    "Parameters:\n"
+    "  a = {a:.2f}\n"
+    "    • a > 0: Opens UP (V-shape)\n"
+    "    • a < 0: Opens DOWN (∧-shape)\n"
+    "    • |a| larger = steeper\n\n"
+    "  h = {h:.2f}\n"
+    "    • Horizontal shift\n\n"
+    "  k = {k:.2f}\n"
+    "    • Vertical shift\n\n"
+    "Key Points:\n"
+    "  Vertex: ({h:.2f}, {k:.2f})\n"
+)
+
+SINE_INFO_FMT = (
+    "SINE FUNCTION\n"
+    + SEP + "\n\n"
+    "Equation: {equation}\n\n"
+    "Parameters:\n"
+    "  a = {a:.2f}\n"
+    "    • Amplitude (height)\n\n"
+    "  Frequency = {freq:.2f}\n"
+    "    • Higher = more waves\n\n"
+    "  Phase = {c:.2f}\n"
+    "    • Horizontal shift\n\n"
+    "  d = {d:.2f}\n"
+    "    • Vertical shift\n\n"
+    "Key Points:\n"
+    "  Y-intercept: (0, {d:.2f})\n"
+)
+
 # Initial parameters
 state = {
     "function_type": "Linear",
@@ -105,12 +204,14 @@ def sine_func(x, a, freq, c, d):
 # -----------------------------
 def update_graph():
     """Update the graph based on current parameters."""
-    x = np.linspace(-10, 10, 1000)
-    
+    x = _X
+
     func_type = state["function_type"]
     
     if func_type == "Linear":
         y = linear_func(x, state["m"], state["b"])
+        # A line's extremes sit at the domain endpoints
+        y_min, y_max = min(y[0], y[-1]), max(y[0], y[-1])
         equation = f"y = {state['m']:.2f}x + {state['b']:.2f}"
         # Key points: y-intercept and x-intercept
         key_x = [0]
@@ -120,120 +221,88 @@ def update_graph():
             if -10 <= x_int <= 10:
                 key_x.append(x_int)
                 key_y.append(0)
-        info = (
-            f"LINEAR FUNCTION\n"
-            f"{'='*28}\n\n"
-            f"Equation: {equation}\n\n"
-            f"Parameters:\n"
-            f"  m (slope) = {state['m']:.2f}\n"
-            f"    • Positive = rises\n"
-            f"    • Negative = falls\n"
-            f"    • Steeper = larger |m|\n\n"
-            f"  b (y-intercept) = {state['b']:.2f}\n"
-            f"    • Where line crosses y-axis\n\n"
-            f"Key Points:\n"
-            f"  Y-intercept: (0, {state['b']:.2f})\n"
-        )
+        info = LINEAR_INFO_FMT.format(equation=equation, m=state["m"], b=state["b"])
         if state["m"] != 0:
             x_int = -state["b"] / state["m"]
             if -10 <= x_int <= 10:
                 info += f"  X-intercept: ({x_int:.2f}, 0)\n"
     
     elif func_type == "Quadratic":
-        y = quadratic_func(x, state["a"], state["m"], state["b"])
+        # Horner form: two multiply-adds per point instead of pow + 3 mults
+        y = np.polyval([state["a"], state["m"], state["b"]], x)
         equation = f"y = {state['a']:.2f}x² + {state['m']:.2f}x + {state['b']:.2f}"
         # Key points: vertex, y-intercept
         vertex_x = -state["m"] / (2 * state["a"]) if state["a"] != 0 else 0
-        vertex_y = quadratic_func(vertex_x, state["a"], state["m"], state["b"])
+        # Plain scalar Horner evaluation; keep the array helper for the curve
+        vertex_y = (state["a"] * vertex_x + state["m"]) * vertex_x + state["b"]
+        # Parabola extremes: endpoints, plus the vertex when it's in view
+        candidates = [y[0], y[-1]]
+        if -10 <= vertex_x <= 10:
+            candidates.append(vertex_y)
+        y_min, y_max = min(candidates), max(candidates)
         key_x = [0, vertex_x]
         key_y = [state["b"], vertex_y]
-        info = (
-            f"QUADRATIC FUNCTION\n"
-            f"{'='*28}\n\n"
-            f"Equation: {equation}\n\n"
-            f"Parameters:\n"
-            f"  a = {state['a']:.2f}\n"
-            f"    • a > 0: Opens UP (U-shape)\n"
-            f"    • a < 0: Opens DOWN (∩-shape)\n"
-            f"    • |a| larger = narrower\n\n"
-            f"  b = {state['m']:.2f}\n"
-            f"    • Affects horizontal position\n\n"
-            f"  c = {state['b']:.2f}\n"
-            f"    • Y-intercept\n\n"
-            f"Key Points:\n"
-            f"  Vertex: ({vertex_x:.2f}, {vertex_y:.2f})\n"
-            f"  Y-intercept: (0, {state['b']:.2f})\n"
+        info = QUADRATIC_INFO_FMT.format(
+            equation=equation, a=state["a"], m=state["m"], b=state["b"],
+            vertex_x=vertex_x, vertex_y=vertex_y
         )
     
     elif func_type == "Exponential":
-        # Limit x range to avoid overflow
-        x = np.linspace(-5, 5, 1000)
-        y = exponential_func(x, state["a"], state["b_exp"], state["c"])
-        # Clip y values for display
-        y = np.clip(y, -10, 10)
+        # Sample only where the curve stays inside the display window
+        # (|a·b^x + c| <= 10) instead of computing huge b^x values and
+        # clipping them afterwards. Solving a·b^x + c = ±10 for x gives
+        # the bound; b^x is monotonic, so one side of the domain suffices.
+        x_lo, x_hi = -5.0, 5.0
+        a_coef, b_base = state["a"], state["b_exp"]
+        if a_coef != 0 and abs(b_base - 1.0) > 1e-9:
+            limit = (10 - state["c"]) / a_coef if a_coef > 0 else (-10 - state["c"]) / a_coef
+            x_bound = math.log(limit) / math.log(b_base)
+            if b_base > 1:
+                x_hi = min(5.0, max(-5.0, x_bound))
+            else:
+                x_lo = max(-5.0, min(5.0, x_bound))
+        x = np.linspace(x_lo, x_hi, N_SAMPLES)
+        y = exponential_func(x, a_coef, b_base, state["c"])
+        # b^x is monotonic, so the endpoints bound the curve
+        y_min, y_max = min(y[0], y[-1]), max(y[0], y[-1])
         equation = f"y = {state['a']:.2f}·{state['b_exp']:.2f}^x + {state['c']:.2f}"
         key_x = [0]
         key_y = [state["a"] + state["c"]]
-        info = (
-            f"EXPONENTIAL FUNCTION\n"
-            f"{'='*28}\n\n"
-            f"Equation: {equation}\n\n"
-            f"Parameters:\n"
-            f"  a = {state['a']:.2f}\n"
-            f"    • Vertical stretch\n\n"
-            f"  Base = {state['b_exp']:.2f}\n"
-            f"    • b > 1: Grows\n"
-            f"    • 0 < b < 1: Decays\n\n"
-            f"  c = {state['c']:.2f}\n"
-            f"    • Vertical shift\n\n"
-            f"Key Points:\n"
-            f"  Y-intercept: (0, {state['a'] + state['c']:.2f})\n"
+        info = EXPONENTIAL_INFO_FMT.format(
+            equation=equation, a=state["a"], b_exp=state["b_exp"],
+            c=state["c"], y0=state["a"] + state["c"]
         )
     
     elif func_type == "Absolute Value":
+        # Inject the vertex so the V-kink stays sharp at coarse sampling
+        x = np.insert(x, np.searchsorted(x, state["h"]), state["h"])
         y = absolute_func(x, state["a"], state["h"], state["k"])
+        # V-shape extremes: endpoints plus the vertex (always in view,
+        # since |h| <= 5)
+        y_min = min(y[0], y[-1], state["k"])
+        y_max = max(y[0], y[-1], state["k"])
         equation = f"y = {state['a']:.2f}|x - {state['h']:.2f}| + {state['k']:.2f}"
         # Key point: vertex (h, k)
         key_x = [state["h"]]
         key_y = [state["k"]]
-        info = (
-            f"ABSOLUTE VALUE FUNCTION\n"
-            f"{'='*28}\n\n"
-            f"Equation: {equation}\n\n"
-            f"Parameters:\n"
-            f"  a = {state['a']:.2f}\n"
-            f"    • a > 0: Opens UP (V-shape)\n"
-            f"    • a < 0: Opens DOWN (∧-shape)\n"
-            f"    • |a| larger = steeper\n\n"
-            f"  h = {state['h']:.2f}\n"
-            f"    • Horizontal shift\n\n"
-            f"  k = {state['k']:.2f}\n"
-            f"    • Vertical shift\n\n"
-            f"Key Points:\n"
-            f"  Vertex: ({state['h']:.2f}, {state['k']:.2f})\n"
+        info = ABSOLUTE_INFO_FMT.format(
+            equation=equation, a=state["a"], h=state["h"], k=state["k"]
         )
     
     elif func_type == "Sine":
+        # Scale sampling with frequency so high-freq waves stay smooth
+        x = np.linspace(-10, 10, max(N_SAMPLES, int(80 * state["freq"])))
         y = sine_func(x, state["a"], state["freq"], state["c"], state["d"])
+        # No tidy closed form at low frequency (the domain may not cover a
+        # full period), so scan the sampled values
+        y_min, y_max = float(y.min()), float(y.max())
         equation = f"y = {state['a']:.2f}·sin({state['freq']:.2f}x + {state['c']:.2f}) + {state['d']:.2f}"
         # Key points: first few peaks/valleys
         key_x = [0]
         key_y = [state["d"]]
-        info = (
-            f"SINE FUNCTION\n"
-            f"{'='*28}\n\n"
-            f"Equation: {equation}\n\n"
-            f"Parameters:\n"
-            f"  a = {state['a']:.2f}\n"
-            f"    • Amplitude (height)\n\n"
-            f"  Frequency = {state['freq']:.2f}\n"
-            f"    • Higher = more waves\n\n"
-            f"  Phase = {state['c']:.2f}\n"
-            f"    • Horizontal shift\n\n"
-            f"  d = {state['d']:.2f}\n"
-            f"    • Vertical shift\n\n"
-            f"Key Points:\n"
-            f"  Y-intercept: (0, {state['d']:.2f})\n"
+        info = SINE_INFO_FMT.format(
+            equation=equation, a=state["a"], freq=state["freq"],
+            c=state["c"], d=state["d"]
         )
     
     # Update graph
@@ -248,15 +317,12 @@ def update_graph():
     # Update info text
     info_text.set_text(info)
     
-    # Auto-adjust y-axis for better view
-    y_min, y_max = np.min(y), np.max(y)
+    # Auto-adjust y-axis for better view (extents computed per branch above)
     if y_max - y_min > 0.1:
         margin = (y_max - y_min) * 0.1
         ax.set_ylim(y_min - margin, y_max + margin)
     else:
         ax.set_ylim(-10, 10)
-    
-    fig.canvas.draw_idle()
 
 # -----------------------------
 # Controls
@@ -370,8 +436,21 @@ def on_func_change(label):
     update_graph()
     fig.canvas.draw_idle()
 
+# Debounce timer: dragging a slider fires dozens of events per second,
+# each of which used to run a full update_graph(). Instead, coalesce
+# them — the graph recomputes once, 30 ms after the last slider motion.
+def _flush_slider_update():
+    """Run the deferred graph update; the timer fires outside any widget
+    handler, so the redraw has to be requested explicitly here."""
+    update_graph()
+    fig.canvas.draw_idle()
+
+_update_timer = fig.canvas.new_timer(interval=30)
+_update_timer.single_shot = True
+_update_timer.add_callback(_flush_slider_update)
+
 def on_slider_change(val):
-    """Handle slider changes."""
+    """Handle slider changes (debounced)."""
     state["m"] = float(m_slider.val)
     state["b"] = float(b_slider.val)
     state["a"] = float(a_slider.val)
@@ -381,7 +460,8 @@ def on_slider_change(val):
     state["b_exp"] = float(bexp_slider.val)
     state["freq"] = float(freq_slider.val)
     state["d"] = float(d_slider.val)
-    update_graph()
+    _update_timer.stop()
+    _update_timer.start()
 
 def on_reset(_):
     """Reset all parameters to defaults."""
@@ -1,13 +1,94 @@
+import math
+
 import numpy as np
 import matplotlib.pyplot as plt
 from matplotlib.animation import FuncAnimation
 from matplotlib.widgets import Slider, Button
-from matplotlib.patches import Polygon
-from matplotlib import cm
+from matplotlib.patches import FancyArrowPatch
+from matplotlib.collections import PolyCollection
+
+try:
+    from numba import njit
+except ImportError:  # numba is optional; fall back to plain Python
+    njit = None
 
 # -----------------------------
 # Kepler orbit utilities
 # -----------------------------
+def _solve_kepler_scalar(M, e, tol, max_iters):
+    """Solve Kepler's equation for a single mean anomaly, using plain math
+    calls so the per-frame path avoids NumPy's 0-d array dispatch.
+
+    Uses Markley's (1995) cubic starter followed by Halley refinement;
+    the starter is already accurate to ~1e-4 for any 0 <= e < 1, so one
+    or two cubically-converging steps reach 1e-10 instead of the handful
+    of Newton iterations a cold start needs.
+    """
+    if e < 1e-12:
+        return M
+
+    two_pi = 2 * math.pi
+    # Markley's starter wants M in (-pi, pi]; remember the whole turns
+    # removed so E - e sin(E) = M holds on the caller's branch
+    shift = math.floor(M / two_pi) * two_pi
+    Mr = M - shift
+    if Mr > math.pi:
+        Mr -= two_pi
+        shift += two_pi
+
+    pi2 = math.pi * math.pi
+    alpha = (3 * pi2 + 1.6 * math.pi * (math.pi - abs(Mr)) / (1 + e)) / (pi2 - 6)
+    d = 3 * (1 - e) + alpha * e
+    q = 2 * alpha * d * (1 - e) - Mr * Mr
+    r = 3 * alpha * d * (d - 1 + e) * Mr + Mr ** 3
+    w = (abs(r) + math.sqrt(q ** 3 + r * r)) ** (2.0 / 3.0)
+    E = (2 * r * w / (w * w + w * q + q * q) + Mr) / d
+
+    # Halley refinement: cubic convergence, typically done in 1-2 steps
+    for _ in range(max_iters):
+        sE = math.sin(E)
+        fp = 1 - e * math.cos(E)
+        f = E - e * sE - Mr
+        delta = f * fp / (fp * fp - 0.5 * f * e * sE)
+        E -= delta
+        if abs(delta) < tol:
+            break
+    return E + shift
+
+
+if njit is not None:
+    _solve_kepler_scalar = njit(cache=True, fastmath=True)(_solve_kepler_scalar)
+
+
+def _orbit_point_kernel(e, M, sqrt_ome2, semilatus):
+    """Fused Kepler solve -> true anomaly -> position -> velocity for one
+    mean anomaly. One scalar kernel in place of the ~15 separate NumPy
+    calls orbit_point() used to chain per frame. sqrt(1-e^2) and the
+    semilatus rectum a(1-e^2) only change with e, so the caller passes
+    them in precomputed."""
+    E = _solve_kepler_scalar(M, e, 1e-10, 50)
+    cE = math.cos(E)
+    sE = math.sin(E)
+    denom = 1 - e * cE
+    cosf = (cE - e) / denom
+    sinf = sqrt_ome2 * sE / denom
+    f = math.atan2(sinf, cosf)
+    r = semilatus / (1 + e * cosf)
+    x = r * cosf
+    y = r * sinf
+    # v_r = sqrt(GM/(a(1-e^2))) * e*sin(f), v_t = sqrt(GM/(a(1-e^2))) * (1 + e*cos(f))
+    inv = 1.0 / math.sqrt(semilatus)
+    v_radial = inv * e * sinf
+    v_tangential = inv * (1 + e * cosf)
+    vx = v_radial * cosf - v_tangential * sinf
+    vy = v_radial * sinf + v_tangential * cosf
+    return x, y, r, f, vx, vy
+
+
+if njit is not None:
+    _orbit_point_kernel = njit(cache=True, fastmath=True)(_orbit_point_kernel)
+
+
 def solve_kepler(M, e, tol=1e-10, max_iters=50):
     """
     Solve Kepler's equation: M = E - e sin(E) for E (eccentric anomaly)
@@ -29,19 +110,33 @@ def solve_kepler(M, e, tol=1e-10, max_iters=50):
     E : float or array
         Eccentric anomaly (radians)
     """
-    # Handle array inputs
+    # Scalar fast path: animate() hits this once per frame
+    if np.ndim(M) == 0:
+        return _solve_kepler_scalar(float(M), e, tol, max_iters)
+
     M = np.asarray(M)
-    scalar_input = M.ndim == 0
-    if scalar_input:
-        M = M[None]
-    
-    # Initial guess: better for high eccentricity
-    E = np.where(e < 0.8, M, np.pi)
-    
+
+    two_pi = 2 * np.pi
+    shift = np.floor(M / two_pi) * two_pi
+    Mr = M - shift
+    over = Mr > np.pi
+    Mr = Mr - np.where(over, two_pi, 0.0)
+    shift = shift + np.where(over, two_pi, 0.0)
+
+    # Markley starter, vectorized (same construction as the scalar path);
+    # leaves Newton only 1-2 iterations of polish to do
+    pi2 = np.pi * np.pi
+    alpha = (3 * pi2 + 1.6 * np.pi * (np.pi - np.abs(Mr)) / (1 + e)) / (pi2 - 6)
+    d = 3 * (1 - e) + alpha * e
+    q = 2 * alpha * d * (1 - e) - Mr * Mr
+    r = 3 * alpha * d * (d - 1 + e) * Mr + Mr ** 3
+    w = (np.abs(r) + np.sqrt(q ** 3 + r * r)) ** (2.0 / 3.0)
+    E = (2 * r * w / (w * w + w * q + q * q) + Mr) / d
+
     for _ in range(max_iters):
-        f = E - e * np.sin(E) - M
+        f = E - e * np.sin(E) - Mr
         fp = 1 - e * np.cos(E)
-        
+
         # Avoid division by zero (shouldn't happen for e < 1, but be safe)
         delta = np.where(np.abs(fp) > 1e-12, f / fp, 0)
         E_new = E - delta
@@ -51,10 +146,10 @@ def solve_kepler(M, e, tol=1e-10, max_iters=50):
             break
             
         E = E_new
-    
-    return E[0] if scalar_input else E
 
-def orbit_point(a, e, M):
+    return E + shift
+
+def orbit_point(a, e, M, sqrt_ome2=None, semilatus=None):
     """
     From mean anomaly M, compute position (x,y) and velocity for an orbit with 
     semi-major axis a and eccentricity e, with the Sun at one focus.
@@ -69,44 +164,16 @@ def orbit_point(a, e, M):
         True anomaly (radians)
     vx, vy : float
         Velocity components (in units where GM=1, or scaled)
-    """
-    E = solve_kepler(M, e)
-    
-    # True anomaly
-    cosf = (np.cos(E) - e) / (1 - e*np.cos(E))
-    sinf = (np.sqrt(1 - e**2) * np.sin(E)) / (1 - e*np.cos(E))
-    f = np.arctan2(sinf, cosf)
-
-    # Distance from focus
-    r = a * (1 - e**2) / (1 + e*np.cos(f))
 
-    x = r * np.cos(f)
-    y = r * np.sin(f)
-    
-    # Velocity components (using vis-viva equation and angular momentum conservation)
-    # For unit GM: v^2 = GM(2/r - 1/a), and h = r^2 * df/dt = sqrt(GM*a*(1-e^2))
-    # Angular velocity: df/dt = h / r^2
-    h = np.sqrt(a * (1 - e**2))  # angular momentum (scaled, assuming GM=1)
-    omega = h / (r * r)  # angular velocity
-    
-    # Velocity in polar coordinates: radial = dr/dt, tangential = r * df/dt
-    # dr/dt = (a(1-e^2)e sin(f)) / (1+e cos(f))^2 * df/dt
-    # For simplicity, compute velocity from orbital mechanics
-    # v_r = sqrt(GM/(a(1-e^2))) * e*sin(f)
-    # v_t = sqrt(GM/(a(1-e^2))) * (1 + e*cos(f))
-    v_mag_sq = (2/r - 1/a)  # vis-viva (assuming GM=1)
-    v_mag = np.sqrt(max(0, v_mag_sq))
-    
-    # Velocity direction: perpendicular to radius vector, with radial component
-    # Using conservation of angular momentum and energy
-    v_radial = np.sqrt(1/(a*(1-e**2))) * e * np.sin(f)
-    v_tangential = np.sqrt(1/(a*(1-e**2))) * (1 + e*np.cos(f))
-    
-    # Convert to Cartesian
-    vx = v_radial * np.cos(f) - v_tangential * np.sin(f)
-    vy = v_radial * np.sin(f) + v_tangential * np.cos(f)
-    
-    return x, y, r, f, vx, vy
+    sqrt_ome2 and semilatus (sqrt(1-e^2) and a(1-e^2)) may be supplied by
+    callers that cache them per eccentricity; otherwise they are derived
+    here.
+    """
+    if sqrt_ome2 is None:
+        sqrt_ome2 = math.sqrt(1 - e * e)
+    if semilatus is None:
+        semilatus = a * (1 - e * e)
+    return _orbit_point_kernel(e, float(M), sqrt_ome2, semilatus)
 
 def triangle_area(x1, y1, x2, y2):
     # area of triangle with vertices (0,0), (x1,y1), (x2,y2)
@@ -119,6 +186,10 @@ a = 1.0            # semi-major axis (scaled units)
 e0 = 0.35          # eccentricity (0 circle, close to 1 very stretched)
 dt0 = 0.08         # mean anomaly step per frame (acts like time step)
 num_wedges = 8     # how many equal-time wedges to display
+HIST_LEN = num_wedges + 1  # ring-buffer capacity for recent planet positions
+
+# Colormap for the wedge areas, resolved once instead of per frame
+_VIRIDIS = plt.get_cmap('viridis')
 
 # State
 state = {
@@ -126,7 +197,17 @@ state = {
     "dt": dt0,
     "M": 0.0,
     "paused": False,
-    "history": []  # store recent points for wedge display
+    "frame": 0,    # frame counter, used to throttle the info panel
+    # Recent points for wedge display: fixed ring buffer written in place,
+    # instead of a list of tuples re-sliced every frame
+    "history": np.zeros((HIST_LEN, 2)),
+    "hist_idx": 0,    # next write slot
+    "hist_count": 0,  # valid entries (saturates at HIST_LEN)
+    # Quantities derived from e, refreshed by on_e_change so the per-frame
+    # path doesn't recompute them
+    "one_minus_e2": 1 - e0 * e0,
+    "sqrt_ome2": math.sqrt(1 - e0 * e0),
+    "semilatus": a * (1 - e0 * e0)
 }
 
 # -----------------------------
@@ -157,11 +238,18 @@ planet, = ax.plot([], [], marker="o", markersize=8, label="Planet", color="blue"
 # Radius line Sun->Planet
 radius_line, = ax.plot([], [], lw=1.5, color="gray", alpha=0.5)
 
-# Velocity vector
-velocity_arrow = None  # Will be created dynamically
+# Velocity vector (one persistent patch, repositioned in place each frame)
+velocity_arrow = FancyArrowPatch(
+    (0, 0), (0, 0), arrowstyle='-|>', mutation_scale=12,
+    color='red', alpha=0.7, zorder=5
+)
+velocity_arrow.set_visible(False)
+ax.add_patch(velocity_arrow)
 
-# Wedge patches (polygons)
-wedge_polys = []
+# Wedge triangles batched into a single collection: one draw call for all
+# of them, and facecolors assigned as one RGBA array
+wedge_coll = PolyCollection([], alpha=0.3, edgecolors='black', linewidths=0.5)
+ax.add_collection(wedge_coll, autolim=False)
 
 # Text panel - positioned on the right side, outside the plot area
 ax_text = plt.axes([0.72, 0.22, 0.27, 0.73])
@@ -196,25 +284,29 @@ btn_reset = Button(ax_reset, "Reset Orbit")
 # -----------------------------
 # Orbit drawing
 # -----------------------------
+# Orbit curves cached per slider value; the e slider has valstep=0.01 over
+# [0, 0.85], so at most 86 entries ever accumulate.
+_orbit_cache = {}
+
 def redraw_orbit():
-    """Vectorized orbit drawing for better performance."""
+    """Vectorized orbit drawing, memoized per eccentricity."""
     e = state["e"]
-    Ms = np.linspace(0, 2*np.pi, 500)
-    # Vectorize the computation
-    Es = solve_kepler(Ms, e)
-    cosf = (np.cos(Es) - e) / (1 - e*np.cos(Es))
-    sinf = (np.sqrt(1 - e**2) * np.sin(Es)) / (1 - e*np.cos(Es))
-    f = np.arctan2(sinf, cosf)
-    r = a * (1 - e**2) / (1 + e*np.cos(f))
-    xs = r * np.cos(f)
-    ys = r * np.sin(f)
-    orbit_line.set_data(xs, ys)
+    key = int(round(e * 100))
+    hit = _orbit_cache.get(key)
+    if hit is None:
+        Ms = np.linspace(0, 2*np.pi, 500)
+        # Vectorize the computation
+        Es = solve_kepler(Ms, e)
+        cosf = (np.cos(Es) - e) / (1 - e*np.cos(Es))
+        sinf = (state["sqrt_ome2"] * np.sin(Es)) / (1 - e*np.cos(Es))
+        f = np.arctan2(sinf, cosf)
+        r = state["semilatus"] / (1 + e*np.cos(f))
+        hit = (r * np.cos(f), r * np.sin(f))
+        _orbit_cache[key] = hit
+    orbit_line.set_data(*hit)
 
 def clear_wedges():
-    global wedge_polys
-    for p in wedge_polys:
-        p.remove()
-    wedge_polys = []
+    wedge_coll.set_verts([])
 
 def update_info(latest_area=None, areas=None, vx=None, vy=None, r=None):
     """Update information panel with orbital parameters and statistics."""
@@ -236,7 +328,7 @@ def update_info(latest_area=None, areas=None, vx=None, vy=None, r=None):
     
     # Area statistics
     area_stats = ""
-    if areas and len(areas) > 0:
+    if areas is not None and len(areas) > 0:
         mean_area = np.mean(areas)
         std_area = np.std(areas)
         cv = (std_area / mean_area * 100) if mean_area > 0 else 0  # coefficient of variation
@@ -269,51 +361,38 @@ def update_info(latest_area=None, areas=None, vx=None, vy=None, r=None):
 # -----------------------------
 def draw_wedges():
     """
-    Draw wedges for the most recent (num_wedges+1) points.
+    Update the wedge polygons for the most recent (num_wedges+1) points.
     Each wedge is triangle between consecutive points and the Sun.
     Uses color gradient to visualize area differences.
     """
-    clear_wedges()
-    pts = state["history"][-(num_wedges+1):]
-    if len(pts) < 2:
+    count = state["hist_count"]
+    if count < 2:
+        clear_wedges()
         return
 
-    areas = []
-    for i in range(len(pts) - 1):
-        x1, y1 = pts[i]
-        x2, y2 = pts[i + 1]
-        A = triangle_area(x1, y1, x2, y2)
-        areas.append(A)
+    # Chronological view of the ring buffer (oldest point first)
+    if count < HIST_LEN:
+        pts = state["history"][:count]
+    else:
+        pts = np.roll(state["history"], -state["hist_idx"], axis=0)
+
+    # All triangle areas in one cross-product expression: the wedge at the
+    # focus spanned by consecutive radius vectors (replaces the Python loop
+    # over triangle_area).
+    areas = 0.5 * np.abs(pts[:-1, 0] * pts[1:, 1] - pts[:-1, 1] * pts[1:, 0])
+
+    wedge_coll.set_verts(
+        [[(0, 0), pts[i], pts[i + 1]] for i in range(len(pts) - 1)]
+    )
 
     # Color code wedges based on area (normalized)
     # Use a colormap to visualize area differences
-    colors_list = []
-    if len(areas) > 0:
-        areas_arr = np.array(areas)
-        mean_area = np.mean(areas_arr)
-        if mean_area > 0:
-            normalized = np.clip(areas_arr / (mean_area * 1.5), 0, 1)
-            colormap = cm.get_cmap('viridis')
-            colors_rgba = colormap(normalized)
-            colors_list = [colors_rgba[i] for i in range(len(areas))]
-        else:
-            colors_list = ['blue'] * len(areas)
+    mean_area = np.mean(areas)
+    if mean_area > 0:
+        normalized = np.clip(areas / (mean_area * 1.5), 0, 1)
+        wedge_coll.set_facecolors(_VIRIDIS(normalized))
     else:
-        colors_list = ['blue'] * max(len(pts) - 1, 1)
-    
-    for i in range(len(pts) - 1):
-        x1, y1 = pts[i]
-        x2, y2 = pts[i + 1]
-        poly = Polygon(
-            [[0, 0], [x1, y1], [x2, y2]], 
-            closed=True, 
-            alpha=0.3,
-            facecolor=colors_list[i] if i < len(colors_list) else 'blue',
-            edgecolor='black',
-            linewidth=0.5
-        )
-        ax.add_patch(poly)
-        wedge_polys.append(poly)
+        wedge_coll.set_facecolor('blue')
 
     # Update info with area statistics
     return areas
@@ -323,17 +402,25 @@ def draw_wedges():
 # -----------------------------
 def on_e_change(val):
     """Handle eccentricity slider change."""
-    global velocity_arrow
     state["e"] = float(val)
+    state["one_minus_e2"] = 1 - state["e"] * state["e"]
+    state["sqrt_ome2"] = math.sqrt(state["one_minus_e2"])
+    state["semilatus"] = a * state["one_minus_e2"]
     state["M"] = 0.0
-    state["history"] = []
-    if velocity_arrow is not None:
-        velocity_arrow.remove()
-        velocity_arrow = None
+    state["hist_idx"] = 0
+    state["hist_count"] = 0
+    velocity_arrow.set_visible(False)
     redraw_orbit()
     clear_wedges()
     update_info()
-    fig.canvas.draw_idle()
+    # The blit background still holds the old orbit: the axes limits
+    # never change, so FuncAnimation's view-keyed background cache is
+    # not invalidated on its own and every tick would paint the stale
+    # curve back over the new one. Drop the cache and force a full
+    # draw; the next tick re-captures the background via copy_from_bbox
+    # with the new orbit in it.
+    ani._blit_cache.clear()
+    fig.canvas.draw()
 
 def on_dt_change(val):
     state["dt"] = float(val)
@@ -345,12 +432,10 @@ def on_play(_):
 
 def on_reset(_):
     """Reset animation to initial state."""
-    global velocity_arrow
     state["M"] = 0.0
-    state["history"] = []
-    if velocity_arrow is not None:
-        velocity_arrow.remove()
-        velocity_arrow = None
+    state["hist_idx"] = 0
+    state["hist_count"] = 0
+    velocity_arrow.set_visible(False)
     clear_wedges()
     update_info()
     fig.canvas.draw_idle()
@@ -369,10 +454,8 @@ update_info()
 # -----------------------------
 def animate(_frame):
     """Animation frame update."""
-    global velocity_arrow
-    
     if state["paused"]:
-        return planet, radius_line, orbit_line, info_text
+        return planet, radius_line, velocity_arrow, wedge_coll, info_text
 
     e = state["e"]
     dt = state["dt"]
@@ -380,7 +463,10 @@ def animate(_frame):
     # Advance "time" (mean anomaly)
     state["M"] = (state["M"] + dt) % (2*np.pi)
 
-    x, y, r, f, vx, vy = orbit_point(a, e, state["M"])
+    x, y, r, f, vx, vy = orbit_point(
+        a, e, state["M"],
+        sqrt_ome2=state["sqrt_ome2"], semilatus=state["semilatus"]
+    )
 
     # Update planet position
     planet.set_data([x], [y])
@@ -389,34 +475,38 @@ def animate(_frame):
     radius_line.set_data([0, x], [0, y])
     
     # Update velocity vector visualization
-    if velocity_arrow is not None:
-        velocity_arrow.remove()
     # Scale velocity arrow for visibility (arbitrary scale factor)
     v_scale = 0.3
-    velocity_arrow = ax.arrow(
-        x, y, vx * v_scale, vy * v_scale,
-        head_width=0.05, head_length=0.05,
-        fc='red', ec='red', alpha=0.7, zorder=5
-    )
+    velocity_arrow.set_positions((x, y), (x + vx * v_scale, y + vy * v_scale))
+    velocity_arrow.set_visible(True)
 
-    # Save history for wedges
-    state["history"].append((x, y))
-    if len(state["history"]) > (num_wedges + 1):
-        state["history"] = state["history"][-(num_wedges + 1):]
+    # Save history for wedges (in-place ring-buffer write)
+    state["history"][state["hist_idx"], 0] = x
+    state["history"][state["hist_idx"], 1] = y
+    state["hist_idx"] = (state["hist_idx"] + 1) % HIST_LEN
+    if state["hist_count"] < HIST_LEN:
+        state["hist_count"] += 1
 
     # Draw wedges and get area statistics
     areas = draw_wedges()
-    
-    # Update info panel
-    update_info(
-        latest_area=areas[-1] if areas and len(areas) > 0 else None,
-        areas=areas,
-        vx=vx,
-        vy=vy,
-        r=r
-    )
-    
-    return planet, radius_line, orbit_line, info_text
 
-ani = FuncAnimation(fig, animate, interval=40, blit=False)
+    artists = (planet, radius_line, velocity_arrow, wedge_coll)
+
+    # Rebuilding and re-rasterizing the ~10-line info panel every tick is
+    # needless — 5 Hz is plenty for text. On skipped frames the panel is
+    # left out of the blit list, so its pixels simply stay on screen.
+    state["frame"] += 1
+    if state["frame"] % 5 == 0:
+        update_info(
+            latest_area=areas[-1] if areas is not None and len(areas) > 0 else None,
+            areas=areas,
+            vx=vx,
+            vy=vy,
+            r=r
+        )
+        artists += (info_text,)
+
+    return artists
+
+ani = FuncAnimation(fig, animate, interval=40, blit=True, cache_frame_data=False)
 plt.show()
@@ -1,10 +1,17 @@
+import time
+
 import numpy as np
 import matplotlib.pyplot as plt
 from matplotlib.widgets import Slider, Button, RadioButtons
-from matplotlib.patches import Rectangle, Polygon, Circle, FancyArrowPatch
+from matplotlib.patches import Rectangle, Polygon, Circle
 from matplotlib.lines import Line2D
-from matplotlib.animation import FuncAnimation
-import matplotlib.patches as mpatches
+from matplotlib.collections import (EllipseCollection, LineCollection,
+                                    PolyCollection)
+
+try:
+    from numba import njit
+except ImportError:  # numba is optional; fall back to plain Python
+    njit = None
 
 # -----------------------------
 # Plate Tectonics Simulator
@@ -23,7 +30,7 @@ state = {
     "boundary_type": "Convergent",
     "movement_speed": 50,  # 0-100
     "animate": False,
-    "time": 0.0
+    "frame": 0
 }
 
 # -----------------------------
@@ -34,23 +41,159 @@ plt.subplots_adjust(left=0.08, bottom=0.25, right=0.68, top=0.95)
 
 # Main visualization axes
 ax = plt.axes([0.08, 0.30, 0.58, 0.65])
-ax.set_title("Plate Tectonics Simulator - Junior High Geography", 
+ax.set_title("Plate Tectonics Simulator - Junior High Geography",
              fontsize=14, fontweight='bold', pad=15)
 ax.set_xlim(-1, 1)
 ax.set_ylim(-1, 1)
 ax.axis('off')
 ax.set_facecolor('#e3f2fd')  # Light blue background
+# The viewport is fixed, so skip the data-limit walk matplotlib performs
+# for every added patch (it iterates the patch path even with axis off)
+ax.set_autoscale_on(False)
+ax.use_sticky_edges = False
+
+# -----------------------------
+# Persistent visual elements
+# -----------------------------
+# Every plate, arrow and marker is created once here, hidden, and then
+# only mutated (set_x/set_width/set_positions/set_xdata) per update.
+# Switching boundary types just toggles visibility instead of tearing the
+# scene down and rebuilding it.
+
+# Convergent boundary
+conv_plate_left = Rectangle((-1, -0.8), 1, 1.6, facecolor='#8d6e63',
+                            edgecolor='#5d4037', lw=4, zorder=2, visible=False)
+conv_plate_right = Rectangle((0, -0.8), 1, 1.6, facecolor='#6d4c41',
+                             edgecolor='#5d4037', lw=4, zorder=2, visible=False)
+volc_base = Circle((0, -0.6), 0.08, facecolor='#424242', zorder=3,
+                   visible=False)
+volc_cone = Polygon(np.zeros((3, 2)), closed=True, facecolor='#616161',
+                    edgecolor='#424242', lw=2, zorder=3, visible=False)
+# Movement arrows as Line2D shafts with a triangular tip marker:
+# set_data is far cheaper than FancyArrowPatch, which regenerates its
+# bezier path and mutation-scaled head on every draw
+def _arrow_line(tip_marker):
+    line = Line2D([0, 0], [0, 0], color='blue', linewidth=3,
+                  marker=tip_marker, markevery=[1], markersize=15,
+                  zorder=4, visible=False)
+    ax.add_line(line)
+    return line
+
+conv_arrow1 = _arrow_line('>')
+conv_arrow2 = _arrow_line('<')
+
+# Divergent boundary
+div_plate_left = Rectangle((-1, -0.8), 0.5, 1.6, facecolor='#8d6e63',
+                           edgecolor='#5d4037', lw=4, zorder=2, visible=False)
+div_plate_right = Rectangle((0.5, -0.8), 0.5, 1.6, facecolor='#6d4c41',
+                            edgecolor='#5d4037', lw=4, zorder=2, visible=False)
+rift_valley = Rectangle((0.5, -0.8), 0, 1.6, facecolor='#ff6f00',
+                        edgecolor='#e65100', lw=3, alpha=0.8, zorder=1,
+                        visible=False)
+div_arrow1 = _arrow_line('<')
+div_arrow1.set_data([-0.2, -0.7], [0.5, 0.5])
+div_arrow2 = _arrow_line('>')
+div_arrow2.set_data([0.2, 0.7], [-0.5, -0.5])
+
+# Transform boundary: the four plate pieces (each plate split at the
+# fault line) as one PolyCollection whose quads are resized with a
+# single (4, 4, 2) vertex assignment per frame
+trans_plates = PolyCollection(
+    np.zeros((4, 4, 2)),
+    facecolors=['#8d6e63', '#8d6e63', '#6d4c41', '#6d4c41'],
+    edgecolors='#5d4037', linewidths=4, zorder=2, visible=False)
+# Fixed quad anchors: left-top, left-bottom, right-bottom, right-top
+_TRANS_X = np.array([-1.0, -1.0, 0.0, 0.0])
+trans_arrow1 = _arrow_line('<')
+trans_arrow1.set_data([-0.5, -0.8], [-0.4, -0.4])
+trans_arrow2 = _arrow_line('>')
+trans_arrow2.set_data([0.5, 0.8], [0.4, 0.4])
+
+# One dashed red boundary line shared by all three views: vertical
+# marker for Convergent/Divergent, horizontal fault for Transform; the
+# styling is identical so a single LineCollection fed one segment covers
+# all of them
+boundary_line = LineCollection(np.zeros((1, 2, 2)), colors='red',
+                               linewidths=5, linestyles='--', alpha=0.8,
+                               zorder=5, visible=False)
+
+for _patch in (conv_plate_left, conv_plate_right, volc_base, volc_cone,
+               div_plate_left, div_plate_right, rift_valley):
+    ax.add_patch(_patch)
+ax.add_collection(trans_plates, autolim=False)
+ax.add_collection(boundary_line, autolim=False)
+
+_BOUNDARY_ARTISTS = {
+    "Convergent": (conv_plate_left, conv_plate_right, volc_base, volc_cone,
+                   conv_arrow1, conv_arrow2, boundary_line),
+    "Divergent": (div_plate_left, div_plate_right, rift_valley,
+                  div_arrow1, div_arrow2, boundary_line),
+    "Transform": (trans_plates, boundary_line, trans_arrow1, trans_arrow2),
+}
+
+# Fixed-capacity pools for the per-frame effects: five mountain
+# triangles and 3 epicenters x 3 rings of earthquake circles, repositioned
+# with set_xy/set_center instead of being rebuilt
+MAX_MOUNTAINS = 5
+EQ_RADII = (0.06, 0.10, 0.14)
+
+# All mountain triangles share one facecolor and edgecolor, so they
+# live in a single PolyCollection fed an (n, 3, 2) vertex array rather
+# than five separate Polygon patches
+mtn_coll = PolyCollection(np.zeros((MAX_MOUNTAINS, 3, 2)),
+                          facecolors='#757575', edgecolors='#424242',
+                          linewidths=2, zorder=3, visible=False)
+ax.add_collection(mtn_coll, autolim=False)
 
-# Visual elements
-plate_left = None
-plate_right = None
-mountains = []
-volcanoes = []
-earthquakes = []
-rift_valley = None
-fault_line = None
-arrows = []
-boundary_marker = None
+# All nine rings (3 epicenters x 3 radii) in one collection: a single
+# draw call and one offsets update instead of nine Circle patches
+eq_coll = EllipseCollection(
+    widths=np.tile(np.array(EQ_RADII) * 2, 3),
+    heights=np.tile(np.array(EQ_RADII) * 2, 3),
+    angles=0, units='xy', offsets=np.zeros((9, 2)),
+    offset_transform=ax.transData, facecolors='none', edgecolors='orange',
+    linewidths=3, alpha=0.7, zorder=4, visible=False)
+ax.add_collection(eq_coll, autolim=False)
+EQ_X = np.repeat([-0.3, 0.0, 0.3], 3)
+
+# Label pool: each Text (and its round-box backing) is created once and
+# repositioned/re-worded per update instead of being torn down, which
+# avoids re-parsing boxstyle strings and re-shaping fonts every frame
+labels = {
+    "plate_a": ax.text(-0.5, 0, "PLATE A", ha='center', va='center',
+                       fontsize=14, fontweight='bold', color='white',
+                       zorder=3, visible=False),
+    "plate_b": ax.text(0.5, 0, "PLATE B", ha='center', va='center',
+                       fontsize=14, fontweight='bold', color='white',
+                       zorder=3, visible=False),
+    "arrow1": ax.text(0, 0, "", ha='center', fontsize=10,
+                      fontweight='bold', color='blue', zorder=5,
+                      visible=False),
+    "arrow2": ax.text(0, 0, "", ha='center', fontsize=10,
+                      fontweight='bold', color='blue', zorder=5,
+                      visible=False),
+    "mountains": ax.text(0, -0.5, "MOUNTAINS\nFORMING!", ha='center',
+                         va='center', fontsize=12, fontweight='bold',
+                         color='darkred',
+                         bbox=dict(boxstyle="round,pad=0.5",
+                                   facecolor="yellow", alpha=0.9),
+                         zorder=6, visible=False),
+    "rift": ax.text(0, 0, "RIFT\nVALLEY", ha='center', va='center',
+                    fontsize=12, fontweight='bold', color='darkorange',
+                    bbox=dict(boxstyle="round,pad=0.5", facecolor="yellow",
+                              alpha=0.9),
+                    zorder=6, visible=False),
+    "earthquakes": ax.text(0, 0, "EARTHQUAKES!", ha='center', fontsize=11,
+                           fontweight='bold', color='orange',
+                           bbox=dict(boxstyle="round,pad=0.5",
+                                     facecolor="yellow", alpha=0.9),
+                           zorder=6, visible=False),
+    "boundary": ax.text(0, 0.9, "", ha='center', fontsize=11,
+                        fontweight='bold', color='red',
+                        bbox=dict(boxstyle="round,pad=0.3",
+                                  facecolor="white", alpha=0.9),
+                        zorder=6, visible=False),
+}
 
 # Info panel
 ax_info = plt.axes([0.68, 0.30, 0.30, 0.65])
@@ -64,356 +207,296 @@ info_text = ax_info.text(
     ha="left",
     fontsize=9,
     family='monospace',
-    bbox=dict(boxstyle="round,pad=1.0", facecolor="#ffffff", alpha=0.95, 
+    bbox=dict(boxstyle="round,pad=1.0", facecolor="#ffffff", alpha=0.95,
              edgecolor="#1976d2", linewidth=2)
 )
 
 # -----------------------------
 # Visualization Functions
 # -----------------------------
-def clear_visualization():
-    """Clear all visual elements."""
-    global plate_left, plate_right, mountains, volcanoes, earthquakes
-    global rift_valley, fault_line, arrows, boundary_marker
-    
-    # Clear boundary_marker first (before checking)
-    if boundary_marker is not None:
-        try:
-            boundary_marker.remove()
-        except (ValueError, AttributeError):
-            pass
-        boundary_marker = None
-    
-    if plate_left is not None:
-        try:
-            if isinstance(plate_left, list):
-                for patch in plate_left:
-                    patch.remove()
-            else:
-                plate_left.remove()
-        except (ValueError, AttributeError):
-            pass
-        plate_left = None
-    
-    if plate_right is not None:
-        try:
-            if isinstance(plate_right, list):
-                for patch in plate_right:
-                    patch.remove()
-            else:
-                plate_right.remove()
-        except (ValueError, AttributeError):
-            pass
-        plate_right = None
-    
-    for mtn in mountains:
-        try:
-            mtn.remove()
-        except (ValueError, AttributeError):
-            pass
-    mountains = []
-    
-    for volc in volcanoes:
-        try:
-            volc.remove()
-        except (ValueError, AttributeError):
-            pass
-    volcanoes = []
-    
-    for eq in earthquakes:
-        try:
-            eq.remove()
-        except (ValueError, AttributeError):
-            pass
-    earthquakes = []
-    
-    if rift_valley is not None:
-        try:
-            rift_valley.remove()
-        except (ValueError, AttributeError):
-            pass
-        rift_valley = None
-    
-    if fault_line is not None:
-        try:
-            fault_line.remove()
-        except (ValueError, AttributeError):
-            pass
-        fault_line = None
-    
-    for arrow in arrows:
-        try:
-            arrow.remove()
-        except (ValueError, AttributeError):
-            pass
-    arrows = []
-
-def clear_text_elements():
-    """Clear all text elements from axes."""
-    texts_to_remove = []
-    for text in ax.texts:
-        texts_to_remove.append(text)
-    for text in texts_to_remove:
-        try:
-            text.remove()
-        except (ValueError, AttributeError):
-            pass
+# Flat, deduplicated tuple of every dynamic artist, computed once so the
+# per-frame hide pass is a single loop with no nested lookups
+_ALL_ARTISTS = tuple(dict.fromkeys(
+    [artist for group in _BOUNDARY_ARTISTS.values() for artist in group]
+    + [mtn_coll, eq_coll] + list(labels.values())))
+
+def _hide_all():
+    """Hide every dynamic artist ahead of the next update."""
+    for artist in _ALL_ARTISTS:
+        artist.set_visible(False)
+
+# Numeric boundary ids so the offset kernel below stays free of string
+# comparisons (and compiles cleanly under numba)
+_BOUNDARY_IDS = {"Convergent": 0, "Divergent": 1, "Transform": 2}
+
+def _boundary_offset(boundary_id, speed, t):
+    """Clamped plate offset for one animation frame.
+
+    boundary_id: 0 = Convergent, 1 = Divergent, 2 = Transform.
+    """
+    if boundary_id == 0:
+        # Plates moving together
+        return max(-0.4, min(0.0, -0.3 + (speed / 100.0) * t * 0.1))
+    if boundary_id == 1:
+        # Plates moving apart
+        return min(0.3, (speed / 100.0) * t * 0.1)
+    # Plates sliding past each other (oscillating movement)
+    return ((speed / 100.0) * t * 0.2) % 0.6 - 0.3
+
+if njit is not None:
+    _boundary_offset = njit(cache=True, fastmath=True)(_boundary_offset)
+
+# Offset lookup table: for a given boundary and speed the clamped
+# kernel only produces a finite run of distinct frames, so those are
+# tabulated once per (boundary, speed) change and each animation tick
+# is just an index.  Saturating boundaries (Convergent/Divergent) hold
+# their last entry; the periodic Transform table covers one slide cycle
+# and wraps.
+_offset_table = np.zeros(1)
+_table_periodic = False
+
+def _rebuild_offset_table():
+    """Tabulate the offsets for the current boundary and speed."""
+    global _offset_table, _table_periodic
+    boundary_id = _BOUNDARY_IDS[state["boundary_type"]]
+    speed = state["movement_speed"]
+    if speed <= 0:
+        n, _table_periodic = 1, False
+    elif boundary_id == 2:
+        n, _table_periodic = int(np.ceil(300.0 / speed / 0.1)), True
+    else:
+        # one step past the clamp time so the final entry saturates
+        n, _table_periodic = int(np.ceil(300.0 / speed / 0.1)) + 1, False
+    table = np.empty(n)
+    for i in range(n):
+        table[i] = _boundary_offset(boundary_id, speed, i * 0.1)
+    _offset_table = table
+
+# Key of the last frame actually drawn; once the clamped offset
+# saturates (e.g. Convergent pinned at 0.0) every further animation tick
+# would redraw an identical scene, so those are skipped outright
+_last_key = None
+
+def _update_convergent(offset):
+    """Mutate the Convergent-view artists for the given plate offset."""
+    # Left plate (with label)
+    conv_plate_left.set_width(1 + offset)
+    conv_plate_left.set_visible(True)
+    labels["plate_a"].set_position((-0.5, 0))
+    labels["plate_a"].set_fontsize(14)
+    labels["plate_a"].set_visible(True)
+
+    # Right plate (with label)
+    conv_plate_right.set_x(offset)
+    conv_plate_right.set_width(1 - offset)
+    conv_plate_right.set_visible(True)
+    labels["plate_b"].set_position((0.5, 0))
+    labels["plate_b"].set_fontsize(14)
+    labels["plate_b"].set_visible(True)
+
+    # Draw mountains at boundary (collision zone)
+    if offset < -0.1:
+        num_mountains = min(int(abs(offset) * 10) + 2, MAX_MOUNTAINS)
+        # All triangle vertices in one (5, 3, 2) array: apex on the
+        # baseline, shoulders at the shared collision height
+        xs = offset + (np.arange(MAX_MOUNTAINS) - 2) * 0.15
+        height = 0.2 + abs(offset) * 0.3
+        verts = np.empty((MAX_MOUNTAINS, 3, 2))
+        verts[:, 0, 0] = xs
+        verts[:, 0, 1] = -0.8
+        verts[:, 1, 0] = xs - 0.12
+        verts[:, 1, 1] = -0.8 + height
+        verts[:, 2, 0] = xs + 0.12
+        verts[:, 2, 1] = -0.8 + height
+        mtn_coll.set_verts(verts[:num_mountains])
+        mtn_coll.set_visible(True)
+
+        # Label mountains
+        labels["mountains"].set_position((offset, -0.5))
+        labels["mountains"].set_visible(True)
+
+    # Volcano (base and cone repositioned in place)
+    if offset < -0.15:
+        volc_x = offset + 0.3
+        volc_base.center = (volc_x, -0.6)
+        volc_base.set_visible(True)
+        volc_cone.set_xy([
+            (volc_x - 0.08, -0.6),
+            (volc_x, -0.4),
+            (volc_x + 0.08, -0.6)
+        ])
+        volc_cone.set_visible(True)
+
+    # Movement arrows (pointing toward boundary) - larger and clearer
+    conv_arrow1.set_data([-0.8, offset + 0.2], [0.5, 0.5])
+    conv_arrow1.set_visible(True)
+    labels["arrow1"].set_position((-0.3, 0.6))
+    labels["arrow1"].set_text("MOVING")
+    labels["arrow1"].set_visible(True)
+
+    conv_arrow2.set_data([0.8, offset - 0.2], [-0.5, -0.5])
+    conv_arrow2.set_visible(True)
+    labels["arrow2"].set_position((0.3, -0.6))
+    labels["arrow2"].set_text("MOVING")
+    labels["arrow2"].set_visible(True)
+
+    # Boundary marker - thicker and more visible
+    boundary_line.set_segments([[(offset, -0.8), (offset, 0.8)]])
+    boundary_line.set_visible(True)
+
+    # Boundary label
+    labels["boundary"].set_position((offset, 0.9))
+    labels["boundary"].set_text("COLLISION ZONE")
+    labels["boundary"].set_visible(True)
+
+def _update_divergent(offset):
+    """Mutate the Divergent-view artists for the given plate offset."""
+    # Left plate (with label)
+    div_plate_left.set_width(0.5 + offset)
+    div_plate_left.set_visible(True)
+    labels["plate_a"].set_position((-0.5, 0))
+    labels["plate_a"].set_fontsize(14)
+    labels["plate_a"].set_visible(True)
+
+    # Right plate (with label)
+    div_plate_right.set_x(0.5 - offset)
+    div_plate_right.set_width(0.5 + offset)
+    div_plate_right.set_visible(True)
+    labels["plate_b"].set_position((0.5, 0))
+    labels["plate_b"].set_fontsize(14)
+    labels["plate_b"].set_visible(True)
+
+    # Rift valley (gap between plates) - more visible
+    if offset > 0.05:
+        rift_valley.set_x(0.5 - offset)
+        rift_valley.set_width(offset * 2)
+        rift_valley.set_visible(True)
+        # Label the rift
+        labels["rift"].set_visible(True)
+
+    # Movement arrows (fixed geometry, pointing away from boundary)
+    div_arrow1.set_visible(True)
+    labels["arrow1"].set_position((-0.45, 0.6))
+    labels["arrow1"].set_text("MOVING\nAPART")
+    labels["arrow1"].set_visible(True)
+
+    div_arrow2.set_visible(True)
+    labels["arrow2"].set_position((0.45, -0.6))
+    labels["arrow2"].set_text("MOVING\nAPART")
+    labels["arrow2"].set_visible(True)
+
+    # Boundary marker - thicker
+    boundary_line.set_segments([[(0, -0.8), (0, 0.8)]])
+    boundary_line.set_visible(True)
+
+    # Boundary label
+    labels["boundary"].set_position((0, 0.9))
+    labels["boundary"].set_text("DIVERGENT BOUNDARY")
+    labels["boundary"].set_visible(True)
+
+def _update_transform(offset):
+    """Mutate the Transform-view artists for the given plate offset."""
+    # All four plate pieces resized in one vertex assignment: each
+    # plate is split at the fault, with the two halves sliding in
+    # opposite directions
+    y = np.array([offset, -0.8, -0.8, -offset])
+    h = np.array([0.8 - offset, 0.8 + offset, 0.8 - offset, 0.8 + offset])
+    verts = np.empty((4, 4, 2))
+    verts[:, 0, 0] = _TRANS_X
+    verts[:, 0, 1] = y
+    verts[:, 1, 0] = _TRANS_X + 1
+    verts[:, 1, 1] = y
+    verts[:, 2, 0] = _TRANS_X + 1
+    verts[:, 2, 1] = y + h
+    verts[:, 3, 0] = _TRANS_X
+    verts[:, 3, 1] = y + h
+    trans_plates.set_verts(verts)
+    trans_plates.set_visible(True)
+
+    labels["plate_a"].set_position((-0.5, 0.3))
+    labels["plate_a"].set_fontsize(12)
+    labels["plate_a"].set_visible(True)
+    labels["plate_b"].set_position((0.5, -0.3))
+    labels["plate_b"].set_fontsize(12)
+    labels["plate_b"].set_visible(True)
+
+    # Fault line - thicker and more visible
+    fault_y = offset
+    boundary_line.set_segments([[(-1, fault_y), (1, fault_y)]])
+    boundary_line.set_visible(True)
+
+    # Movement arrows (fixed geometry, horizontal, opposite directions)
+    trans_arrow1.set_visible(True)
+    labels["arrow1"].set_position((-0.65, -0.5))
+    labels["arrow1"].set_text("SLIDING")
+    labels["arrow1"].set_visible(True)
+
+    trans_arrow2.set_visible(True)
+    labels["arrow2"].set_position((0.65, 0.5))
+    labels["arrow2"].set_text("SLIDING")
+    labels["arrow2"].set_visible(True)
+
+    # Earthquakes (shaking effect) - more visible
+    if abs(offset) > 0.1:
+        eq_coll.set_offsets(np.column_stack((EQ_X, np.full(9, fault_y))))
+        eq_coll.set_visible(True)
+
+        # Label earthquakes
+        labels["earthquakes"].set_position((0, fault_y + 0.2))
+        labels["earthquakes"].set_visible(True)
+
+    # Boundary label
+    labels["boundary"].set_position((0, 0.9))
+    labels["boundary"].set_text("TRANSFORM BOUNDARY")
+    labels["boundary"].set_visible(True)
+
+_BOUNDARY_HANDLERS = {
+    "Convergent": _update_convergent,
+    "Divergent": _update_divergent,
+    "Transform": _update_transform,
+}
 
 def draw_plates():
     """Draw the tectonic plates visualization."""
-    global plate_left, plate_right, boundary_marker, rift_valley, fault_line
-    
-    clear_visualization()
-    clear_text_elements()  # Clear text labels
-    
+    global _last_key
+
     boundary = state["boundary_type"]
-    speed = state["movement_speed"]
-    time = state["time"]
-    
-    # Calculate plate positions based on boundary type and time
-    if boundary == "Convergent":
-        # Plates moving together
-        offset = -0.3 + (speed / 100) * time * 0.1
-        offset = max(-0.4, min(0.0, offset))
-        
-        # Left plate (with label)
-        global plate_left
-        plate_left = Rectangle((-1, -0.8), 1 + offset, 1.6,
-                              facecolor='#8d6e63', edgecolor='#5d4037', lw=4, zorder=2)
-        ax.add_patch(plate_left)
-        ax.text(-0.5, 0, "PLATE A", ha='center', va='center', 
-               fontsize=14, fontweight='bold', color='white', zorder=3)
-        
-        # Right plate (with label)
-        global plate_right
-        plate_right = Rectangle((offset, -0.8), 1 - offset, 1.6,
-                               facecolor='#6d4c41', edgecolor='#5d4037', lw=4, zorder=2)
-        ax.add_patch(plate_right)
-        ax.text(0.5, 0, "PLATE B", ha='center', va='center', 
-               fontsize=14, fontweight='bold', color='white', zorder=3)
-        
-        # Draw mountains at boundary (collision zone)
-        if offset < -0.1:
-            num_mountains = int(abs(offset) * 10) + 2
-            for i in range(min(num_mountains, 5)):
-                x = offset + (i - 2) * 0.15
-                height = 0.2 + abs(offset) * 0.3
-                # Mountain triangle
-                mtn_points = [
-                    (x, -0.8),
-                    (x - 0.12, -0.8 + height),
-                    (x + 0.12, -0.8 + height)
-                ]
-                mtn = Polygon(mtn_points, closed=True, facecolor='#757575', 
-                             edgecolor='#424242', lw=2, zorder=3)
-                ax.add_patch(mtn)
-                mountains.append(mtn)
-            
-            # Label mountains
-            if mountains:
-                ax.text(offset, -0.5, "MOUNTAINS\nFORMING!", ha='center', va='center',
-                       fontsize=12, fontweight='bold', color='darkred',
-                       bbox=dict(boxstyle="round,pad=0.5", facecolor="yellow", alpha=0.9),
-                       zorder=6)
-        
-        # Draw volcano
-        if offset < -0.15:
-            volc_x = offset + 0.3
-            # Volcano base
-            volc_base = Circle((volc_x, -0.6), 0.08, facecolor='#424242', zorder=3)
-            ax.add_patch(volc_base)
-            # Volcano cone
-            volc_points = [
-                (volc_x - 0.08, -0.6),
-                (volc_x, -0.4),
-                (volc_x + 0.08, -0.6)
-            ]
-            volc = Polygon(volc_points, closed=True, facecolor='#616161', 
-                           edgecolor='#424242', lw=2, zorder=3)
-            ax.add_patch(volc)
-            volcanoes.append(volc_base)
-            volcanoes.append(volc)
-        
-        # Movement arrows (pointing toward boundary) - larger and clearer
-        arrow1 = FancyArrowPatch((-0.8, 0.5), (offset + 0.2, 0.5),
-                                arrowstyle='->', mutation_scale=25, 
-                                color='blue', linewidth=3, zorder=4)
-        ax.add_patch(arrow1)
-        arrows.append(arrow1)
-        ax.text(-0.3, 0.6, "MOVING", ha='center', fontsize=10, 
-               fontweight='bold', color='blue', zorder=5)
-        
-        arrow2 = FancyArrowPatch((0.8, -0.5), (offset - 0.2, -0.5),
-                                arrowstyle='->', mutation_scale=25, 
-                                color='blue', linewidth=3, zorder=4)
-        ax.add_patch(arrow2)
-        arrows.append(arrow2)
-        ax.text(0.3, -0.6, "MOVING", ha='center', fontsize=10, 
-               fontweight='bold', color='blue', zorder=5)
-        
-        # Boundary marker - thicker and more visible
-        boundary_marker = Line2D([offset, offset], [-0.8, 0.8], 
-                                color='red', linewidth=5, linestyle='--', 
-                                alpha=0.8, zorder=5)
-        ax.add_line(boundary_marker)
-        
-        # Boundary label
-        ax.text(offset, 0.9, "COLLISION ZONE", ha='center', fontsize=11,
-               fontweight='bold', color='red',
-               bbox=dict(boxstyle="round,pad=0.3", facecolor="white", alpha=0.9),
-               zorder=6)
-        
-    elif boundary == "Divergent":
-        # Plates moving apart
-        offset = 0.0 + (speed / 100) * time * 0.1
-        offset = min(0.3, offset)
-        
-        # Left plate (with label)
-        plate_left = Rectangle((-1, -0.8), 0.5 + offset, 1.6,
-                              facecolor='#8d6e63', edgecolor='#5d4037', lw=4, zorder=2)
-        ax.add_patch(plate_left)
-        ax.text(-0.5, 0, "PLATE A", ha='center', va='center', 
-               fontsize=14, fontweight='bold', color='white', zorder=3)
-        
-        # Right plate (with label)
-        plate_right = Rectangle((0.5 - offset, -0.8), 0.5 + offset, 1.6,
-                               facecolor='#6d4c41', edgecolor='#5d4037', lw=4, zorder=2)
-        ax.add_patch(plate_right)
-        ax.text(0.5, 0, "PLATE B", ha='center', va='center', 
-               fontsize=14, fontweight='bold', color='white', zorder=3)
-        
-        # Rift valley (gap between plates) - more visible
-        if offset > 0.05:
-            global rift_valley
-            rift_valley = Rectangle((0.5 - offset, -0.8), offset * 2, 1.6,
-                                   facecolor='#ff6f00', edgecolor='#e65100', 
-                                   lw=3, alpha=0.8, zorder=1)
-            ax.add_patch(rift_valley)
-            # Label the rift
-            ax.text(0, 0, "RIFT\nVALLEY", ha='center', va='center',
-                   fontsize=12, fontweight='bold', color='darkorange',
-                   bbox=dict(boxstyle="round,pad=0.5", facecolor="yellow", alpha=0.9),
-                   zorder=6)
-        
-        # Movement arrows (pointing away from boundary) - larger
-        arrow1 = FancyArrowPatch((-0.2, 0.5), (-0.7, 0.5),
-                                arrowstyle='->', mutation_scale=25, 
-                                color='blue', linewidth=3, zorder=4)
-        ax.add_patch(arrow1)
-        arrows.append(arrow1)
-        ax.text(-0.45, 0.6, "MOVING\nAPART", ha='center', fontsize=10, 
-               fontweight='bold', color='blue', zorder=5)
-        
-        arrow2 = FancyArrowPatch((0.2, -0.5), (0.7, -0.5),
-                                arrowstyle='->', mutation_scale=25, 
-                                color='blue', linewidth=3, zorder=4)
-        ax.add_patch(arrow2)
-        arrows.append(arrow2)
-        ax.text(0.45, -0.6, "MOVING\nAPART", ha='center', fontsize=10, 
-               fontweight='bold', color='blue', zorder=5)
-        
-        # Boundary marker - thicker
-        boundary_marker = Line2D([0, 0], [-0.8, 0.8], 
-                                color='red', linewidth=5, linestyle='--', 
-                                alpha=0.8, zorder=5)
-        ax.add_line(boundary_marker)
-        
-        # Boundary label
-        ax.text(0, 0.9, "DIVERGENT BOUNDARY", ha='center', fontsize=11,
-               fontweight='bold', color='red',
-               bbox=dict(boxstyle="round,pad=0.3", facecolor="white", alpha=0.9),
-               zorder=6)
-        
-    elif boundary == "Transform":
-        # Plates sliding past each other
-        offset = (speed / 100) * time * 0.2
-        offset = offset % 0.6 - 0.3  # Oscillating movement
-        
-        # Left plate (top and bottom pieces with labels)
-        plate_left_top = Rectangle((-1, -0.8 + 0.8 + offset), 1, 0.8 - offset,
-                              facecolor='#8d6e63', edgecolor='#5d4037', lw=4, zorder=2)
-        ax.add_patch(plate_left_top)
-        ax.text(-0.5, 0.3, "PLATE A", ha='center', va='center', 
-               fontsize=12, fontweight='bold', color='white', zorder=3)
-        
-        plate_left_bottom = Rectangle((-1, -0.8), 1, 0.8 + offset,
-                                      facecolor='#8d6e63', edgecolor='#5d4037', lw=4, zorder=2)
-        ax.add_patch(plate_left_bottom)
-        
-        # Right plate (top and bottom pieces with labels)
-        plate_right_bottom = Rectangle((0, -0.8), 1, 0.8 - offset,
-                               facecolor='#6d4c41', edgecolor='#5d4037', lw=4, zorder=2)
-        ax.add_patch(plate_right_bottom)
-        ax.text(0.5, -0.3, "PLATE B", ha='center', va='center', 
-               fontsize=12, fontweight='bold', color='white', zorder=3)
-        
-        plate_right_top = Rectangle((0, -0.8 + 0.8 - offset), 1, 0.8 + offset,
-                                   facecolor='#6d4c41', edgecolor='#5d4037', lw=4, zorder=2)
-        ax.add_patch(plate_right_top)
-        
-        # Fault line - thicker and more visible
-        fault_y = -0.8 + 0.8 + offset
-        fault_line = Line2D([-1, 1], [fault_y, fault_y], 
-                           color='red', linewidth=5, linestyle='--', 
-                           alpha=0.8, zorder=5)
-        ax.add_line(fault_line)
-        
-        # Movement arrows (horizontal, opposite directions) - larger
-        arrow1 = FancyArrowPatch((-0.5, -0.4), (-0.8, -0.4),
-                                arrowstyle='->', mutation_scale=25, 
-                                color='blue', linewidth=3, zorder=4)
-        ax.add_patch(arrow1)
-        arrows.append(arrow1)
-        ax.text(-0.65, -0.5, "SLIDING", ha='center', fontsize=10, 
-               fontweight='bold', color='blue', zorder=5)
-        
-        arrow2 = FancyArrowPatch((0.5, 0.4), (0.8, 0.4),
-                                arrowstyle='->', mutation_scale=25, 
-                                color='blue', linewidth=3, zorder=4)
-        ax.add_patch(arrow2)
-        arrows.append(arrow2)
-        ax.text(0.65, 0.5, "SLIDING", ha='center', fontsize=10, 
-               fontweight='bold', color='blue', zorder=5)
-        
-        # Earthquakes (shaking effect) - more visible
-        if abs(offset) > 0.1:
-            for i in range(3):
-                eq_x = -0.3 + i * 0.3
-                eq_y = fault_y
-                # Earthquake symbol (concentric circles) - larger
-                for r in [0.06, 0.10, 0.14]:
-                    eq = Circle((eq_x, eq_y), r, fill=False, 
-                               edgecolor='orange', linewidth=3, 
-                               alpha=0.7, zorder=4)
-                    ax.add_patch(eq)
-                    earthquakes.append(eq)
-            
-            # Label earthquakes
-            ax.text(0, fault_y + 0.2, "EARTHQUAKES!", ha='center', fontsize=11,
-                   fontweight='bold', color='orange',
-                   bbox=dict(boxstyle="round,pad=0.5", facecolor="yellow", alpha=0.9),
-                   zorder=6)
-        
-        # Boundary label
-        ax.text(0, 0.9, "TRANSFORM BOUNDARY", ha='center', fontsize=11,
-               fontweight='bold', color='red',
-               bbox=dict(boxstyle="round,pad=0.3", facecolor="white", alpha=0.9),
-               zorder=6)
-        
-        # Store plate references (already stored above)
-        pass
-    
-    # Update info panel
-    update_info(boundary, speed)
+
+    # Look up the plate offset for the current animation frame
+    i = state["frame"]
+    if _table_periodic:
+        i %= len(_offset_table)
+    else:
+        i = min(i, len(_offset_table) - 1)
+    offset = _offset_table[i]
+
+    key = (boundary, round(offset, 3))
+    if key == _last_key:
+        return
+    _last_key = key
+
+    _hide_all()
+    _BOUNDARY_HANDLERS[boundary](offset)
+
+_last_info_key = None
 
 def update_info(boundary, speed):
     """Update information panel."""
+    global _last_info_key
+    # The panel only depends on boundary type and speed — not on the
+    # animation time — so it is refreshed from the control handlers, not
+    # from the frame loop, and skipped when its inputs are unchanged
+    key = (boundary, speed)
+    if key == _last_info_key:
+        return
+    _last_info_key = key
+
     effects = {
         "Convergent": "• Mountains form\n• Volcanoes\n• Earthquakes",
         "Divergent": "• Rift valleys\n• New crust forms\n• Mid-ocean ridges",
         "Transform": "• Earthquakes\n• Fault lines\n• No volcanoes"
     }
-    
+
     info = (
         f"╔═══════════════════════════╗\n"
         f"║ PLATE TECTONICS           ║\n"
@@ -444,7 +527,7 @@ def update_info(boundary, speed):
 # -----------------------------
 # Boundary type radio buttons
 ax_boundary = plt.axes([0.08, 0.15, 0.25, 0.08])
-boundary_radio = RadioButtons(ax_boundary, list(BOUNDARY_TYPES.keys()), 
+boundary_radio = RadioButtons(ax_boundary, list(BOUNDARY_TYPES.keys()),
                               active=0)
 
 # Movement speed slider
@@ -463,47 +546,103 @@ btn_reset = Button(ax_reset, "Reset")
 # -----------------------------
 animation = None
 
+# Adaptive frame skip: the timer fires every 33 ms regardless of how
+# long the previous render took, so the wall time between ticks is
+# smoothed (EWMA) and the simulation advances however many 33 ms steps
+# actually elapsed.  On a loaded GUI the plates keep real-time speed
+# instead of slowing down with the frame rate.
+_FRAME_BUDGET = 0.033
+_frame_gap = _FRAME_BUDGET
+_last_tick = None
+
 def animate(frame):
-    """Animation function."""
+    """Animation function; returns the dirty artists so blitting only
+    re-rasterizes their bounding boxes."""
+    global _frame_gap, _last_tick
     if state["animate"]:
-        state["time"] += 0.1
+        now = time.perf_counter()
+        if _last_tick is not None:
+            _frame_gap = 0.9 * _frame_gap + 0.1 * (now - _last_tick)
+        _last_tick = now
+        steps = max(1, int(round(_frame_gap / _FRAME_BUDGET)))
+        state["frame"] += steps
         draw_plates()
-    return []
+    return _ALL_ARTISTS
+
+def _clear_animated():
+    """Drop the animated flag blitting sets on returned artists so
+    ordinary (non-blit) redraws pick them up again."""
+    for artist in _ALL_ARTISTS:
+        artist.set_animated(False)
 
 # -----------------------------
 # Event Handlers
 # -----------------------------
 def on_boundary_change(label):
     """Handle boundary type change."""
+    global _last_key
     state["boundary_type"] = label
-    state["time"] = 0.0
+    state["frame"] = 0
+    _rebuild_offset_table()
+    _last_key = None
     draw_plates()
+    update_info(label, state["movement_speed"])
+
+# Redraw coalescing: a slider drag emits many change events per GUI
+# tick; each updates the artists, but only one canvas render is queued
+# until the backend actually draws
+_pending = False
+
+def _schedule_redraw():
+    """Request a canvas render unless one is already queued."""
+    global _pending
+    if not _pending:
+        _pending = True
+        fig.canvas.draw_idle()
+
+def _on_draw(_event):
+    global _pending
+    _pending = False
+
+fig.canvas.mpl_connect('draw_event', _on_draw)
 
 def on_speed_change(val):
     """Handle speed slider change."""
     state["movement_speed"] = val
+    _rebuild_offset_table()
     draw_plates()
+    update_info(state["boundary_type"], val)
+    _schedule_redraw()
 
 def on_animate(_):
     """Toggle animation."""
-    global animation
+    global animation, _last_tick
+    # Forget the previous tick so a pause doesn't feed a huge gap into
+    # the frame-skip average when the animation resumes
+    _last_tick = None
+    # Deferred so the animation machinery is only wired up the first
+    # time someone actually presses Animate
+    from matplotlib.animation import FuncAnimation
     state["animate"] = not state["animate"]
     if state["animate"]:
         btn_animate.label.set_text("Stop")
         if animation is None:
-            animation = FuncAnimation(fig, animate, interval=50, 
-                                     blit=False, cache_frame_data=False)
+            animation = FuncAnimation(fig, animate, interval=33,
+                                     blit=True, cache_frame_data=False)
     else:
         btn_animate.label.set_text("Animate")
         if animation is not None:
             animation.event_source.stop()
             animation = None
+        _clear_animated()
     fig.canvas.draw_idle()
 
 def on_reset(_):
     """Reset to initial state."""
-    global animation
-    state["time"] = 0.0
+    global animation, _last_key, _last_tick
+    _last_key = None
+    _last_tick = None
+    state["frame"] = 0
     state["animate"] = False
     if animation is not None:
         try:
@@ -511,8 +650,10 @@ def on_reset(_):
         except AttributeError:
             pass
         animation = None
+    _clear_animated()
     btn_animate.label.set_text("Animate")
     draw_plates()
+    update_info(state["boundary_type"], state["movement_speed"])
 
 # Wire up events
 boundary_radio.on_clicked(on_boundary_change)
@@ -521,6 +662,12 @@ btn_animate.on_clicked(on_animate)
 btn_reset.on_clicked(on_reset)
 
 # Initial visualization
+_rebuild_offset_table()
 draw_plates()
+update_info(state["boundary_type"], state["movement_speed"])
+# Warm-up render before the window appears: the first full draw
+# populates matplotlib's transform, font, and marker-path caches (the
+# arrow tips re-use their cached rotated marker path afterwards), so
+# the first interactive frame doesn't pay those one-time costs
+fig.canvas.draw()
 plt.show()
-